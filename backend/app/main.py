@@ -13,12 +13,14 @@ from contextlib import asynccontextmanager
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from .config import get_settings
 from .database import init_db
 from .logging_config import configure_logging
 from .middleware import RequestLoggingMiddleware
 from .routers import admin, applications, auth
+from .utils.constants import BANKS, INVESTOR_CATEGORIES, MONTHS, TENORS, TITLES
 
 settings = get_settings()
 logger = structlog.get_logger()
@@ -81,21 +83,19 @@ async def health_check():
     return {"status": "healthy", "app": settings.app_name}
 
 
-@app.get("/api/constants")
-async def get_constants():
-    """Return form constants (banks, categories, tenors, titles)."""
-    from .utils.constants import (
-        BANKS,
-        INVESTOR_CATEGORIES,
-        MONTHS,
-        TENORS,
-        TITLES,
-    )
-
-    return {
+# The form constants never change at runtime, so encode the response body once
+_CONSTANTS_BODY = JSONResponse(
+    {
         "banks": BANKS,
         "investor_categories": INVESTOR_CATEGORIES,
         "months": MONTHS,
         "tenors": TENORS,
         "titles": TITLES,
     }
+).body
+
+
+@app.get("/api/constants")
+async def get_constants():
+    """Return form constants (banks, categories, tenors, titles)."""
+    return Response(content=_CONSTANTS_BODY, media_type="application/json")
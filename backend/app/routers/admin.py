@@ -3,7 +3,7 @@
 import io
 import os
 import uuid
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Annotated
 
@@ -11,7 +11,7 @@ import pandas as pd
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
 from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy import func
+from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session
 
 # Configure upload directory
@@ -19,6 +19,12 @@ UPLOAD_DIR = Path("/app/uploads/payment_documents")
 ALLOWED_EXTENSIONS = {".pdf", ".jpg", ".jpeg", ".png"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# xlsxwriter writes exports faster than openpyxl. Cell text is stored
+# verbatim, never turned into formulas or hyperlinks.
+EXCEL_WRITER_KWARGS = {
+    "options": {"strings_to_formulas": False, "strings_to_urls": False}
+}
+
 from ..database import get_db
 from ..models.application import Application
 from ..models.payment import Payment, PaymentDocument
@@ -59,7 +65,14 @@ def apply_filters(query, filters: AdminFilters):
         query = query.filter(Application.submission_date >= filters.start_date)
 
     if filters.end_date:
-        query = query.filter(Application.submission_date <= filters.end_date)
+        # submission_date carries a time of day, so a bare end date has to cover
+        # the whole day: compare against the next day's prefix instead
+        try:
+            next_day = date.fromisoformat(filters.end_date) + timedelta(days=1)
+        except ValueError:
+            query = query.filter(Application.submission_date <= filters.end_date)
+        else:
+            query = query.filter(Application.submission_date < next_day.isoformat())
 
     if filters.min_value is not None:
         query = query.filter(Application.bond_value >= filters.min_value)
@@ -74,17 +87,26 @@ def apply_filters(query, filters: AdminFilters):
         query = query.filter(Application.payment_status.in_(filters.payment_statuses))
 
     if filters.search:
-        search_term = f"%{filters.search}%"
+        # Plain substring match: autoescape keeps % and _ in the term literal
+        search = filters.search
         query = query.filter(
-            (Application.full_name.ilike(search_term))
-            | (Application.company_name.ilike(search_term))
-            | (Application.email.ilike(search_term))
-            | (Application.phone_number.ilike(search_term))
+            Application.full_name.icontains(search, autoescape=True)
+            | Application.company_name.icontains(search, autoescape=True)
+            | Application.email.icontains(search, autoescape=True)
+            | Application.phone_number.icontains(search, autoescape=True)
         )
 
     return query
 
 
+def applications_frame(query) -> pd.DataFrame:
+    """Load every application column matched by the query into a DataFrame."""
+    columns = Application.__table__.columns
+    return pd.DataFrame(
+        query.with_entities(*columns).all(), columns=[c.key for c in columns]
+    )
+
+
 @router.get("/applications", response_model=ApplicationListResponse)
 async def list_applications(
     current_user: TokenData = Depends(get_current_user),
@@ -184,6 +206,14 @@ async def get_summary(
     )
 
 
+def _in_value_range(min_val: float, max_val: float):
+    """SQL condition for min_val <= bond_value < max_val (open-ended at inf)."""
+    condition = Application.bond_value >= min_val
+    if max_val != float("inf"):
+        condition = and_(condition, Application.bond_value < max_val)
+    return condition
+
+
 @router.get("/analytics", response_model=AnalyticsResponse)
 async def get_analytics(
     current_user: TokenData = Depends(get_current_user),
@@ -231,12 +261,17 @@ async def get_analytics(
         .all()
     )
 
-    # Value distribution
-    all_values = db.query(Application.bond_value).all()
-    value_distribution = []
-    for min_val, max_val, label in BOND_VALUE_RANGES:
-        count = sum(1 for (v,) in all_values if min_val <= v < max_val)
-        value_distribution.append({"range": label, "count": count})
+    # Value distribution, bucketed in a single aggregate query
+    bucket_counts = db.query(
+        *(
+            func.count(case((_in_value_range(min_val, max_val), 1)))
+            for min_val, max_val, _ in BOND_VALUE_RANGES
+        )
+    ).one()
+    value_distribution = [
+        {"range": label, "count": count}
+        for (_, _, label), count in zip(BOND_VALUE_RANGES, bucket_counts)
+    ]
 
     return AnalyticsResponse(
         by_applicant_type=[
@@ -252,6 +287,11 @@ async def get_analytics(
     )
 
 
+def _export_disposition(ext: str) -> str:
+    """Content-Disposition for a dated application export download."""
+    return f"attachment; filename=fgn_bonds_export_{datetime.now():%Y%m%d}.{ext}"
+
+
 @router.get("/export/csv")
 async def export_csv(
     current_user: TokenData = Depends(get_current_user),
@@ -271,26 +311,16 @@ async def export_csv(
 
     query = db.query(Application)
     query = apply_filters(query, filters)
-    applications = query.all()
-
-    # Convert to DataFrame
-    data = [app.__dict__ for app in applications]
-    for d in data:
-        d.pop("_sa_instance_state", None)
+    df = applications_frame(query)
 
-    df = pd.DataFrame(data)
-
-    # Generate CSV
-    output = io.StringIO()
-    df.to_csv(output, index=False)
-    output.seek(0)
+    # Generate CSV straight into bytes rather than encoding a str copy
+    output = io.BytesIO()
+    df.to_csv(output, index=False, encoding="utf-8")
 
     return StreamingResponse(
         iter([output.getvalue()]),
         media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=fgn_bonds_export_{datetime.now().strftime('%Y%m%d')}.csv"
-        },
+        headers={"Content-Disposition": _export_disposition("csv")},
     )
 
 
@@ -313,22 +343,22 @@ async def export_excel(
 
     query = db.query(Application)
     query = apply_filters(query, filters)
-    applications = query.all()
-
-    # Convert to DataFrame
-    data = [app.__dict__ for app in applications]
-    for d in data:
-        d.pop("_sa_instance_state", None)
-
-    df = pd.DataFrame(data)
+    df = applications_frame(query)
 
     # Generate Excel with multiple sheets
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    with pd.ExcelWriter(
+        output, engine="xlsxwriter", engine_kwargs=EXCEL_WRITER_KWARGS
+    ) as writer:
         # Data sheet
         df.to_excel(writer, sheet_name="Applications", index=False)
 
         # Summary sheet
+        stats = (
+            df["bond_value"].agg(["sum", "mean", "min", "max"])
+            if not df.empty
+            else dict.fromkeys(("sum", "mean", "min", "max"), 0)
+        )
         summary_data = {
             "Metric": [
                 "Total Applications",
@@ -339,10 +369,10 @@ async def export_excel(
             ],
             "Value": [
                 len(df),
-                df["bond_value"].sum() if not df.empty else 0,
-                df["bond_value"].mean() if not df.empty else 0,
-                df["bond_value"].min() if not df.empty else 0,
-                df["bond_value"].max() if not df.empty else 0,
+                stats["sum"],
+                stats["mean"],
+                stats["min"],
+                stats["max"],
             ],
         }
         pd.DataFrame(summary_data).to_excel(writer, sheet_name="Summary", index=False)
@@ -359,9 +389,7 @@ async def export_excel(
     return StreamingResponse(
         iter([output.getvalue()]),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename=fgn_bonds_export_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        },
+        headers={"Content-Disposition": _export_disposition("xlsx")},
     )
 
 
@@ -950,56 +978,67 @@ async def export_dmo_report_excel(
     if not include_pending:
         query = query.filter(Application.payment_status == "verified")
 
-    applications = query.all()
-
-    # Build dataframe for detailed applications
-    data = []
-    for app in applications:
-        # Determine applicant name based on type
-        if app.applicant_type == "Corporate":
-            applicant_name = app.company_name
-        else:
-            applicant_name = app.full_name
-
-        row = {
-            "S/N": len(data) + 1,
-            "Applicant Name": applicant_name,
-            "Applicant Type": app.applicant_type,
-            "BVN": app.bvn,
-            "Tenor": app.tenor,
-            "Bond Value (₦)": app.bond_value,
-            "Bank Name": app.bank_name,
-            "Account Number": app.account_number,
-            "Payment Status": app.payment_status,
+    # Fetch only the report columns in one joined query, then format them
+    # column-wise instead of building a dict per application
+    columns = (
+        Application.applicant_type,
+        Application.company_name,
+        Application.full_name,
+        Application.bvn,
+        Application.tenor,
+        Application.bond_value,
+        Application.bank_name,
+        Application.account_number,
+        Application.payment_status,
+        Payment.payment_reference,
+        Payment.payment_date,
+        Payment.payment_method,
+        Payment.amount,
+    )
+    rows = pd.DataFrame(
+        query.with_entities(*columns).all(), columns=[c.key for c in columns]
+    )
+    has_payment = rows["payment_reference"].notna()
+
+    df = pd.DataFrame(
+        {
+            "S/N": range(1, len(rows) + 1),
+            "Applicant Name": rows["company_name"].where(
+                rows["applicant_type"] == "Corporate", rows["full_name"]
+            ),
+            "Applicant Type": rows["applicant_type"],
+            "BVN": rows["bvn"],
+            "Tenor": rows["tenor"],
+            "Bond Value (₦)": rows["bond_value"],
+            "Bank Name": rows["bank_name"],
+            "Account Number": rows["account_number"],
+            "Payment Status": rows["payment_status"],
+            "Payment Reference": rows["payment_reference"].fillna(""),
+            "Payment Date": rows["payment_date"].fillna(""),
+            "Payment Method": rows["payment_method"].fillna(""),
+            # Convert from kobo
+            "Amount Received (₦)": (rows["amount"] / 100)
+            .astype(object)
+            .where(has_payment, ""),
         }
+    )
 
-        # Add payment details if available
-        if app.payment:
-            row["Payment Reference"] = app.payment.payment_reference
-            row["Payment Date"] = app.payment.payment_date
-            row["Payment Method"] = app.payment.payment_method
-            row["Amount Received (₦)"] = app.payment.amount / 100  # Convert from kobo
-        else:
-            row["Payment Reference"] = ""
-            row["Payment Date"] = ""
-            row["Payment Method"] = ""
-            row["Amount Received (₦)"] = ""
-
-        data.append(row)
-
-    df = pd.DataFrame(data)
-
-    # Calculate summary
-    total_apps = len(applications)
-    total_value = sum(app.bond_value for app in applications)
-    verified_apps = [a for a in applications if a.payment_status == "verified"]
-    verified_value = sum(a.bond_value for a in verified_apps)
-    apps_2year = [a for a in applications if a.tenor == "2-Year"]
-    apps_3year = [a for a in applications if a.tenor == "3-Year"]
+    # Calculate summary: one grouped pass per breakdown
+    by_tenor = (
+        rows.groupby("tenor")["bond_value"]
+        .agg(["count", "sum"])
+        .reindex(["2-Year", "3-Year"], fill_value=0)
+    )
+    verified = rows.loc[rows["payment_status"] == "verified", "bond_value"]
+    total_apps = len(rows)
+    total_value = int(rows["bond_value"].sum())
 
-    # Generate Excel
+    # Generate Excel; the report timestamp and filename share one clock read
+    generated_at = datetime.now()
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    with pd.ExcelWriter(
+        output, engine="xlsxwriter", engine_kwargs=EXCEL_WRITER_KWARGS
+    ) as writer:
         # Summary sheet
         summary_data = {
             "Metric": [
@@ -1022,15 +1061,15 @@ async def export_dmo_report_excel(
                 total_apps,
                 total_value,
                 "",
-                len(apps_2year),
-                sum(a.bond_value for a in apps_2year),
-                len(apps_3year),
-                sum(a.bond_value for a in apps_3year),
+                int(by_tenor.at["2-Year", "count"]),
+                int(by_tenor.at["2-Year", "sum"]),
+                int(by_tenor.at["3-Year", "count"]),
+                int(by_tenor.at["3-Year", "sum"]),
                 "",
-                len(verified_apps),
-                verified_value,
+                len(verified),
+                int(verified.sum()),
                 "",
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                generated_at.strftime("%Y-%m-%d %H:%M:%S"),
             ],
         }
         pd.DataFrame(summary_data).to_excel(writer, sheet_name="Summary", index=False)
@@ -1041,7 +1080,7 @@ async def export_dmo_report_excel(
 
     output.seek(0)
 
-    filename = f"DMO_Report_{month_of_offer}_{year}_{datetime.now().strftime('%Y%m%d')}.xlsx"
+    filename = f"DMO_Report_{month_of_offer}_{year}_{generated_at:%Y%m%d}.xlsx"
 
     return StreamingResponse(
         iter([output.getvalue()]),
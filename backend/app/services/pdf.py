@@ -8,9 +8,13 @@ import structlog
 
 from ..models.application import Application
 
-# Import the copied PDF generator
+# Import the copied PDF generator. The `pdf` package lives in the backend
+# directory; add that once (not the package itself, whose modules would
+# otherwise shadow top-level names like `styles`).
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "pdf"))
+_BACKEND_DIR = str(Path(__file__).resolve().parents[2])
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
 from pdf.generator import PDFGenerator
 
 logger = structlog.get_logger()
@@ -4,12 +4,14 @@ PDF Generation Module
 Provides professional PDF generation matching the official DMO FGNSB subscription form.
 """
 
-from .generator import PDFGenerator
+from .generator import FGNSBBatchGenerator, PDFGenerator, generate_batch
 from .styles import PDFColors, PDFStyles
 from .templates import FGNSBTemplate
 
 __all__ = [
     'PDFGenerator',
+    'FGNSBBatchGenerator',
+    'generate_batch',
     'PDFColors',
     'PDFStyles',
     'FGNSBTemplate',
@@ -12,6 +12,18 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from .styles import PDFColors, PDFStyles
 from typing import Optional, List
 
+# Pre-resolved style constants for the draw() hot paths
+_GREEN = PDFColors.DMO_GREEN
+_GREEN_LIGHT = PDFColors.DMO_GREEN_LIGHT
+_BLACK = PDFColors.BLACK
+_WHITE = PDFColors.WHITE
+_GRAY = PDFColors.GRAY
+_FONT = PDFStyles.FONT_FAMILY
+_FONT_B = PDFStyles.FONT_FAMILY_BOLD
+_FS_HEADER = PDFStyles.FONT_SIZE_SECTION_HEADER
+_FS_BODY = PDFStyles.FONT_SIZE_BODY
+_FS_SMALL = PDFStyles.FONT_SIZE_SMALL
+
 
 class CheckboxField(Flowable):
     """
@@ -33,21 +45,21 @@ class CheckboxField(Flowable):
         canvas = self.canv
 
         # Draw checkbox box
-        canvas.setStrokeColor(PDFColors.DMO_GREEN)
+        canvas.setStrokeColor(_GREEN)
         canvas.setLineWidth(1)
         canvas.rect(0, (self.height - self.size) / 2, self.size, self.size)
 
         # Draw checkmark if checked
         if self.checked:
-            canvas.setFillColor(PDFColors.DMO_GREEN)
-            canvas.setFont(PDFStyles.FONT_FAMILY_BOLD, self.size - 2)
+            canvas.setFillColor(_GREEN)
+            canvas.setFont(_FONT_B, self.size - 2)
             # Draw a checkmark character
             canvas.drawString(1.5, (self.height - self.size) / 2 + 1.5, "X")
 
         # Draw label
-        canvas.setFillColor(PDFColors.BLACK)
-        canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_BODY)
-        canvas.drawString(self.size + 4, (self.height - PDFStyles.FONT_SIZE_BODY) / 2, self.label)
+        canvas.setFillColor(_BLACK)
+        canvas.setFont(_FONT, _FS_BODY)
+        canvas.drawString(self.size + 4, (self.height - _FS_BODY) / 2, self.label)
 
 
 class CheckboxGroup(Flowable):
@@ -82,20 +94,20 @@ class CheckboxGroup(Flowable):
             is_checked = (value == self.selected)
 
             # Draw checkbox
-            canvas.setStrokeColor(PDFColors.DMO_GREEN)
+            canvas.setStrokeColor(_GREEN)
             canvas.setLineWidth(1)
             y = (self.height - self.checkbox_size) / 2
             canvas.rect(x_offset, y, self.checkbox_size, self.checkbox_size)
 
             # Draw checkmark if selected
             if is_checked:
-                canvas.setFillColor(PDFColors.DMO_GREEN)
-                canvas.setFont(PDFStyles.FONT_FAMILY_BOLD, self.checkbox_size - 2)
+                canvas.setFillColor(_GREEN)
+                canvas.setFont(_FONT_B, self.checkbox_size - 2)
                 canvas.drawString(x_offset + 2, y + 2, "X")
 
             # Draw label
-            canvas.setFillColor(PDFColors.BLACK)
-            canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_BODY)
+            canvas.setFillColor(_BLACK)
+            canvas.setFont(_FONT, _FS_BODY)
             label_x = x_offset + self.checkbox_size + 3
             canvas.drawString(label_x, y + 1, label)
 
@@ -127,13 +139,13 @@ class InputBoxes(Flowable):
 
         # Draw prefix if provided
         if self.prefix:
-            canvas.setFillColor(PDFColors.BLACK)
-            canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_SMALL)
-            canvas.drawString(0, (self.box_height - PDFStyles.FONT_SIZE_SMALL) / 2, self.prefix)
+            canvas.setFillColor(_BLACK)
+            canvas.setFont(_FONT, _FS_SMALL)
+            canvas.drawString(0, (self.box_height - _FS_SMALL) / 2, self.prefix)
             x_offset = len(self.prefix) * 5 + 4
 
         # Draw boxes
-        canvas.setStrokeColor(PDFColors.DMO_GREEN)
+        canvas.setStrokeColor(_GREEN)
         canvas.setLineWidth(0.75)
 
         for i in range(self.num_boxes):
@@ -144,11 +156,11 @@ class InputBoxes(Flowable):
 
             # Draw character if available
             if i < len(self.value):
-                canvas.setFillColor(PDFColors.BLACK)
-                canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_BODY)
+                canvas.setFillColor(_BLACK)
+                canvas.setFont(_FONT, _FS_BODY)
                 # Center the character in the box
                 char_x = box_x + (self.box_width - 5) / 2
-                char_y = (self.box_height - PDFStyles.FONT_SIZE_BODY) / 2
+                char_y = (self.box_height - _FS_BODY) / 2
                 canvas.drawString(char_x, char_y, self.value[i])
 
 
@@ -180,13 +192,13 @@ class SignatureLine(Flowable):
         canvas = self.canv
 
         # Draw signature line
-        canvas.setStrokeColor(PDFColors.BLACK)
+        canvas.setStrokeColor(_BLACK)
         canvas.setLineWidth(0.5)
         canvas.line(0, 15, self.line_width, 15)
 
         # Draw label
-        canvas.setFillColor(PDFColors.BLACK)
-        canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_SMALL)
+        canvas.setFillColor(_BLACK)
+        canvas.setFont(_FONT, _FS_SMALL)
         canvas.drawString(0, 3, self.label)
 
         # Draw date line if included
@@ -212,15 +224,15 @@ class StampArea(Flowable):
         canvas = self.canv
 
         # Draw border
-        canvas.setStrokeColor(PDFColors.DMO_GREEN)
+        canvas.setStrokeColor(_GREEN)
         canvas.setLineWidth(1)
         canvas.rect(0, 10, self.width, self.height - 10)
 
         # Draw label
-        canvas.setFillColor(PDFColors.BLACK)
-        canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_SMALL)
+        canvas.setFillColor(_BLACK)
+        canvas.setFont(_FONT, _FS_SMALL)
         # Center the label below the box
-        label_width = canvas.stringWidth(self.label, PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_SMALL)
+        label_width = canvas.stringWidth(self.label, _FONT, _FS_SMALL)
         canvas.drawString((self.width - label_width) / 2, 0, self.label)
 
 
@@ -241,31 +253,24 @@ class SectionHeader(Flowable):
     def draw(self):
         canvas = self.canv
 
-        # Draw letter cell background
-        canvas.setFillColor(PDFColors.DMO_GREEN)
+        # Fill both cell backgrounds, then stroke the outer border once
+        canvas.setFillColor(_GREEN)
         canvas.rect(0, 0, self.letter_width, self.height, fill=1, stroke=0)
-
-        # Draw letter
-        canvas.setFillColor(PDFColors.WHITE)
-        canvas.setFont(PDFStyles.FONT_FAMILY_BOLD, PDFStyles.FONT_SIZE_SECTION_HEADER)
-        letter_x = (self.letter_width - canvas.stringWidth(self.letter, PDFStyles.FONT_FAMILY_BOLD,
-                                                          PDFStyles.FONT_SIZE_SECTION_HEADER)) / 2
-        canvas.drawString(letter_x, 5, self.letter)
-
-        # Draw title background
-        canvas.setFillColor(PDFColors.DMO_GREEN_LIGHT)
+        canvas.setFillColor(_GREEN_LIGHT)
         canvas.rect(self.letter_width, 0, self.width - self.letter_width, self.height, fill=1, stroke=0)
-
-        # Draw title
-        canvas.setFillColor(PDFColors.BLACK)
-        canvas.setFont(PDFStyles.FONT_FAMILY_BOLD, PDFStyles.FONT_SIZE_SECTION_HEADER)
-        canvas.drawString(self.letter_width + 8, 5, self.title)
-
-        # Draw border
-        canvas.setStrokeColor(PDFColors.DMO_GREEN)
+        canvas.setStrokeColor(_GREEN)
         canvas.setLineWidth(1)
         canvas.rect(0, 0, self.width, self.height, fill=0, stroke=1)
 
+        # Draw letter and title in a single font group
+        canvas.setFont(_FONT_B, _FS_HEADER)
+        if self.letter:
+            canvas.setFillColor(_WHITE)
+            letter_x = (self.letter_width - canvas.stringWidth(self.letter, _FONT_B, _FS_HEADER)) / 2
+            canvas.drawString(letter_x, 5, self.letter)
+        canvas.setFillColor(_BLACK)
+        canvas.drawString(self.letter_width + 8, 5, self.title)
+
 
 class ThumbprintArea(Flowable):
     """
@@ -281,18 +286,18 @@ class ThumbprintArea(Flowable):
         canvas = self.canv
 
         # Draw border
-        canvas.setStrokeColor(PDFColors.DMO_GREEN)
+        canvas.setStrokeColor(_GREEN)
         canvas.setLineWidth(1)
         canvas.rect(0, 15, self.width, self.height - 15)
 
         # Draw section letter
-        canvas.setFillColor(PDFColors.DMO_GREEN)
-        canvas.setFont(PDFStyles.FONT_FAMILY_BOLD, PDFStyles.FONT_SIZE_SECTION_HEADER)
+        canvas.setFillColor(_GREEN)
+        canvas.setFont(_FONT_B, _FS_HEADER)
         canvas.drawString(5, self.height - 12, "C")
 
         # Draw label
-        canvas.setFillColor(PDFColors.BLACK)
-        canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_SMALL)
+        canvas.setFillColor(_BLACK)
+        canvas.setFont(_FONT, _FS_SMALL)
         canvas.drawString(0, 3, "Thumb print of")
         canvas.drawString(0, -6, "illiterate applicant")
 
@@ -317,12 +322,12 @@ class DottedInputLine(Flowable):
 
         # Draw label
         if self.label:
-            canvas.setFillColor(PDFColors.BLACK)
-            canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_BODY)
+            canvas.setFillColor(_BLACK)
+            canvas.setFont(_FONT, _FS_BODY)
             canvas.drawString(0, 4, self.label)
 
         # Draw dotted line
-        canvas.setStrokeColor(PDFColors.GRAY)
+        canvas.setStrokeColor(_GRAY)
         canvas.setLineWidth(0.5)
         canvas.setDash(2, 2)
         line_start = self.label_width if self.label else 0
@@ -331,6 +336,21 @@ class DottedInputLine(Flowable):
 
         # Draw value if provided
         if self.value:
-            canvas.setFillColor(PDFColors.BLACK)
-            canvas.setFont(PDFStyles.FONT_FAMILY, PDFStyles.FONT_SIZE_BODY)
+            canvas.setFillColor(_BLACK)
+            canvas.setFont(_FONT, _FS_BODY)
             canvas.drawString(line_start + 5, 4, str(self.value))
+
+
+class LogoImage(Flowable):
+    """
+    Draws a pre-decoded image so repeated documents can share one ImageReader.
+    """
+
+    def __init__(self, image, width: float = 60, height: float = 45):
+        Flowable.__init__(self)
+        self.image = image
+        self.width = width
+        self.height = height
+
+    def draw(self):
+        self.canv.drawImage(self.image, 0, 0, self.width, self.height, mask='auto')
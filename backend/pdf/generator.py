@@ -8,12 +8,118 @@ Author: Hedgar Ajakaiye
 License: MIT
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+import logging
 import tempfile
 import os
 
-from .templates import FGNSBTemplate
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+
+from .styles import PDFStyles
+from .templates import FGNSBTemplate, format_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+def _batch_output_path(out_dir: str, index: int, record: Dict) -> str:
+    """Output file for a batch record, named by its id when it has one."""
+    return os.path.join(out_dir, f"fgnsb_{record.get('id', index)}.pdf")
+
+
+def _generate_one(job: Tuple[int, Dict], out_dir: str, timestamp: str) -> str:
+    """Render a single record inside a worker process."""
+    index, record = job
+    output_path = _batch_output_path(out_dir, index, record)
+    if not FGNSBTemplate(record).generate(output_path, timestamp):
+        raise RuntimeError(f"Failed to generate PDF for record {index}")
+    return output_path
+
+
+def generate_batch(records: List[Dict], out_dir: str, workers: Optional[int] = None) -> List[str]:
+    """
+    Generate subscription form PDFs for many records across a process pool.
+
+    ReportLab rendering is pure Python and holds the GIL, so batches are fanned
+    out to separate processes. Module-level style and logo caches are built once
+    per worker on import.
+
+    Args:
+        records: List of application data dictionaries
+        out_dir: Directory the PDFs are written to
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Paths of the generated PDF files, in the same order as records
+
+    Raises:
+        RuntimeError: If any PDF fails to generate
+    """
+    if not records:
+        return []
+
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(records) // (workers * 4))
+
+    jobs = list(enumerate(records))
+    timestamp = format_timestamp()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            _generate_one, jobs, [out_dir] * len(jobs), [timestamp] * len(jobs),
+            chunksize=chunksize,
+        ))
+
+
+class FGNSBBatchGenerator:
+    """
+    Renders many subscription forms in sequence through one document template.
+
+    The page template and frame are set up once and each record only rebuilds
+    its flowables. Instances are not thread-safe; use one per thread or process.
+    """
+
+    def __init__(self):
+        margin = PDFStyles.PAGE_MARGIN
+        self._doc = BaseDocTemplate(
+            '',
+            pagesize=A4,
+            leftMargin=margin,
+            rightMargin=margin,
+            topMargin=margin,
+            bottomMargin=margin,
+        )
+        frame = Frame(self._doc.leftMargin, self._doc.bottomMargin,
+                      self._doc.width, self._doc.height, id='normal')
+        self._doc.addPageTemplates([PageTemplate(id='First', frames=frame, pagesize=A4)])
+
+    def generate(self, records: List[Dict], out_dir: str) -> List[str]:
+        """
+        Generate one PDF per record.
+
+        Args:
+            records: List of application data dictionaries
+            out_dir: Directory the PDFs are written to
+
+        Returns:
+            Paths of the generated PDF files, in the same order as records
+
+        Raises:
+            RuntimeError: If a PDF fails to generate
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        timestamp = format_timestamp()
+        paths = []
+        for index, record in enumerate(records):
+            output_path = _batch_output_path(out_dir, index, record)
+            try:
+                self._doc.build(FGNSBTemplate(record).build_document(timestamp), filename=output_path)
+            except Exception as e:
+                raise RuntimeError(f"Failed to generate PDF for record {index}") from e
+            paths.append(output_path)
+        return paths
 
 
 class PDFGenerator:
@@ -104,8 +210,7 @@ class PDFGenerator:
         missing = [f for f in required_fields if not data.get(f)]
         if missing:
             # Log warning but continue - form handler will validate separately
-            import logging
-            logging.warning(f"PDF generation: Missing optional fields: {missing}")
+            logger.warning("PDF generation: Missing optional fields: %s", missing)
 
     def generate_summary_report(self, applications: list, output_path: Optional[str] = None) -> str:
         """
@@ -154,7 +154,7 @@ class PDFStyles:
     @classmethod
     def get_green_header_table_style(cls) -> TableStyle:
         """Table style with green header row matching DMO form"""
-        return TableStyle([
+        return TableStyle((
             # Header row styling
             ('BACKGROUND', (0, 0), (-1, 0), PDFColors.DMO_GREEN),
             ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.WHITE),
@@ -180,12 +180,12 @@ class PDFStyles:
             # Grid
             ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
             ('BOX', (0, 0), (-1, -1), 1.5, PDFColors.DMO_GREEN),
-        ])
+        ))
 
     @classmethod
     def get_form_table_style(cls) -> TableStyle:
         """Standard form table with green borders"""
-        return TableStyle([
+        return TableStyle((
             ('FONTNAME', (0, 0), (-1, -1), cls.FONT_FAMILY),
             ('FONTSIZE', (0, 0), (-1, -1), cls.FONT_SIZE_BODY),
             ('TEXTCOLOR', (0, 0), (-1, -1), PDFColors.BLACK),
@@ -197,12 +197,12 @@ class PDFStyles:
             ('RIGHTPADDING', (0, 0), (-1, -1), 6),
             ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
             ('BOX', (0, 0), (-1, -1), 1.5, PDFColors.DMO_GREEN),
-        ])
+        ))
 
     @classmethod
     def get_label_value_table_style(cls) -> TableStyle:
         """Table style for label-value pairs with bold labels"""
-        return TableStyle([
+        return TableStyle((
             # Label column (first column)
             ('FONTNAME', (0, 0), (0, -1), cls.FONT_FAMILY_BOLD),
             ('FONTSIZE', (0, 0), (0, -1), cls.FONT_SIZE_BODY),
@@ -227,12 +227,12 @@ class PDFStyles:
             # Grid
             ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
             ('BOX', (0, 0), (-1, -1), 1.5, PDFColors.DMO_GREEN),
-        ])
+        ))
 
     @classmethod
     def get_borderless_table_style(cls) -> TableStyle:
         """Table style without borders for layout purposes"""
-        return TableStyle([
+        return TableStyle((
             ('FONTNAME', (0, 0), (-1, -1), cls.FONT_FAMILY),
             ('FONTSIZE', (0, 0), (-1, -1), cls.FONT_SIZE_BODY),
             ('TEXTCOLOR', (0, 0), (-1, -1), PDFColors.BLACK),
@@ -242,12 +242,12 @@ class PDFStyles:
             ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
             ('LEFTPADDING', (0, 0), (-1, -1), 0),
             ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ])
+        ))
 
     @classmethod
     def get_section_label_style(cls) -> TableStyle:
         """Style for section label cells (A, B, C, D)"""
-        return TableStyle([
+        return TableStyle((
             ('BACKGROUND', (0, 0), (0, -1), PDFColors.DMO_GREEN),
             ('TEXTCOLOR', (0, 0), (0, -1), PDFColors.WHITE),
             ('FONTNAME', (0, 0), (0, -1), cls.FONT_FAMILY_BOLD),
@@ -256,4 +256,4 @@ class PDFStyles:
             ('VALIGN', (0, 0), (0, -1), 'MIDDLE'),
             ('TOPPADDING', (0, 0), (0, -1), 4),
             ('BOTTOMPADDING', (0, 0), (0, -1), 4),
-        ])
+        ))
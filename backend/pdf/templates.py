@@ -8,144 +8,409 @@ Author: Hedgar Ajakaiye
 License: MIT
 """
 
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm, inch
 from reportlab.platypus import (
     SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
-    Image, PageBreak, KeepTogether
+    PageBreak, KeepTogether, Flowable
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterator, Optional
+import copy
 import os
 from pathlib import Path
 
 from .styles import PDFColors, PDFStyles
 from .elements import (
     CheckboxField, CheckboxGroup, InputBoxes, PhoneInputBoxes,
-    SignatureLine, StampArea, SectionHeader, ThumbprintArea, DottedInputLine
+    SignatureLine, StampArea, SectionHeader, ThumbprintArea, DottedInputLine,
+    LogoImage
 )
 
+# Attribute validation on graphics shapes is only useful while debugging layouts;
+# follow the backend's DEBUG setting and switch it off otherwise.
+if os.environ.get('DEBUG', '').lower() not in ('1', 'true', 'yes'):
+    rl_config.shapeChecking = 0
+
+# Logo location - pdf module is at /app/pdf/, so parent.parent gives /app
+_ASSETS_PATH = Path(__file__).resolve().parent.parent / 'assets'
+_LOGO_PATH = _ASSETS_PATH / 'dmo_logo.png'
+_LOGO_PATH_STR = str(_LOGO_PATH)
+_LOGO_EXISTS = _LOGO_PATH.exists()
+
+# Page geometry is fixed (A4 with the standard margin), so column widths are
+# resolved once here rather than multiplied out in every _build_* call
+_CONTENT_WIDTH = A4[0] - (2 * PDFStyles.PAGE_MARGIN)
+_HEADER_COLS = (_CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.4, _CONTENT_WIDTH * 0.3)
+_LABEL_VALUE_COLS = (_CONTENT_WIDTH * 0.4, _CONTENT_WIDTH * 0.6)
+_HALF_COLS = (_CONTENT_WIDTH * 0.5, _CONTENT_WIDTH * 0.5)
+_WITNESS_COLS = (100, _CONTENT_WIDTH - 100)
+
+# Paragraph styles are built once per process and shared by every document
+_STYLES = {
+    'to': ParagraphStyle('To', fontName='Helvetica', fontSize=8, leading=10),
+    'logo_text': ParagraphStyle('LogoText', fontName='Helvetica-Bold', fontSize=10,
+                                alignment=TA_CENTER, leading=12),
+    'no': ParagraphStyle('No', fontName='Helvetica', fontSize=8, alignment=TA_RIGHT, leading=10),
+    'title': ParagraphStyle(
+        'Title',
+        fontName='Helvetica-Bold',
+        fontSize=11,
+        alignment=TA_CENTER,
+        textColor=PDFColors.BLACK,
+        spaceAfter=4,
+    ),
+    'instructions': ParagraphStyle(
+        'Instructions',
+        fontName='Helvetica',
+        fontSize=7,
+        alignment=TA_CENTER,
+        textColor=PDFColors.GRAY,
+        leading=9,
+    ),
+    'declaration': ParagraphStyle(
+        'Declaration',
+        fontName='Helvetica-Oblique',
+        fontSize=8,
+        alignment=TA_CENTER,
+        textColor=PDFColors.BLACK,
+    ),
+    'residency': ParagraphStyle(
+        'Residency',
+        fontName='Helvetica-Bold',
+        fontSize=9,
+        alignment=TA_LEFT,
+    ),
+    'thumb': ParagraphStyle('Thumb', fontName='Helvetica', fontSize=8, alignment=TA_CENTER),
+    'sig': ParagraphStyle('Sig', fontName='Helvetica', fontSize=8, leading=10),
+    'footer': ParagraphStyle(
+        'Footer',
+        fontName='Helvetica',
+        fontSize=7,
+        textColor=PDFColors.GRAY,
+        alignment=TA_CENTER,
+    ),
+    'body': PDFStyles.get_body_style(),
+}
+
+_GUIDE_TABLE_STYLE = PDFStyles.get_form_table_style()
+
+# Boilerplate paragraphs are parsed once; each document gets a shallow copy so
+# per-render layout state never leaks between builds
+_STATIC_PARAS = {
+    'to': Paragraph(
+        "<b>To:</b><br/>Director-General,<br/>Debt Management Office, Abuja",
+        _STYLES['to']
+    ),
+    'logo_text': Paragraph("<b>DEBT MANAGEMENT OFFICE<br/>NIGERIA</b>", _STYLES['logo_text']),
+    'no': Paragraph("<b>No:</b> ____________<br/><br/><i>Official use only</i>", _STYLES['no']),
+    'title': Paragraph(
+        "SUBSCRIPTION FORM FOR FEDERAL GOVERNMENT OF NIGERIA SAVINGS BOND (FGNSB)",
+        _STYLES['title']
+    ),
+    'instructions': Paragraph(
+        "Applications must be made in accordance with the instructions set out on the back of this application form. "
+        "Care must be taken to follow these instructions as applications that do not comply with the instructions may be rejected. "
+        "If you are in any doubt, please consult your Stockbroker, Banker, Solicitor, or any professional adviser for guidance.",
+        _STYLES['instructions']
+    ),
+    'declaration': Paragraph(
+        "In response to the advertisement in both print and electronic media, I/We hereby offer my/our subscription for FGNSB",
+        _STYLES['declaration']
+    ),
+    'minimum_value': Paragraph("<b>Minimum Value:</b> N5,000.00", _STYLES['body']),
+    'maximum_value': Paragraph("<b>Maximum Value:</b> N50,000,000.00", _STYLES['body']),
+    'residency': Paragraph(
+        "<b>Residency Classification of Applicant (tick the Appropriate box):</b>",
+        _STYLES['residency']
+    ),
+    'witness_signature': Paragraph("Witness Signature: _______________________", _STYLES['thumb']),
+    'thumbprint': Paragraph("<b>Applicant's Thumbprint</b><br/><br/><br/><br/><br/>", _STYLES['thumb']),
+    'signature': Paragraph(
+        "Usual Signature: _______________________<br/><br/>Date: _______________",
+        _STYLES['sig']
+    ),
+    'stamp': Paragraph("<b>Stamp of Receiving Agent</b>", _STYLES['sig']),
+}
+
+
+def _static_para(key: str) -> Paragraph:
+    """Return a fresh copy of a pre-parsed boilerplate paragraph"""
+    return copy.copy(_STATIC_PARAS[key])
+
+# Table styles shared by every document; the command lists never change per record
+_TENOR_ROW_STYLE = TableStyle((
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (3, 0), (3, 0), 'Helvetica-Bold'),
+), parent=_GUIDE_TABLE_STYLE)
+
+_HEADER_STYLE = TableStyle((
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+    ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+))
+
+_EALLOT_STYLE = TableStyle((
+    ('BACKGROUND', (0, 0), (-1, 0), PDFColors.DMO_GREEN_LIGHT),
+    ('SPAN', (0, 0), (-1, 0)),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+))
+
+_FORM_TABLE_STYLE = TableStyle((
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
+    ('BACKGROUND', (2, 0), (2, -1), PDFColors.LIGHT_GRAY),
+))
+
+_RESIDENCY_STYLE = TableStyle((
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+))
+
+_CATEGORY_HEADER_TEXT = "Investor Category (tick all that apply):"
+_CATEGORY_HEADER_STYLE = TableStyle((
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BACKGROUND', (0, 0), (-1, -1), PDFColors.DMO_GREEN_LIGHT),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+))
+
+_CATEGORY_STYLE = TableStyle((
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+))
+
+_LABEL_TABLE_STYLE = TableStyle((
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
+))
+
+_THUMB_STYLE = TableStyle((
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+))
+
+_SIG_STYLE = TableStyle((
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
+    ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+))
+
+
+def format_timestamp(when: Optional[datetime] = None) -> str:
+    """Format the footer 'Generated on' timestamp"""
+    return f"{when or datetime.now():%Y-%m-%d %H:%M:%S}"
+
+
+def _text(value) -> str:
+    """Coerce an optional form value to display text"""
+    return '' if value is None else str(value)
+
+
+@dataclass(slots=True)
+class _FormFields:
+    """
+    Normalized view of the application record used by the section builders.
+    Values are resolved and coerced once instead of per-cell dict lookups.
+    """
+    applicant_type: str
+    # Bond details
+    tenor: str
+    month_of_offer: str
+    bond_value: float
+    amount_in_words: str
+    cscs_number: str
+    chn_number: str
+    # Individual/Joint fields
+    title: str
+    full_name: str
+    date_of_birth: str
+    phone_number: str
+    email: str
+    occupation: str
+    passport_no: str
+    next_of_kin: str
+    mothers_maiden_name: str
+    address: str
+    # Joint applicant fields
+    joint_title: str
+    joint_full_name: str
+    joint_phone_number: str
+    joint_email: str
+    joint_occupation: str
+    joint_passport_no: str
+    joint_next_of_kin: str
+    joint_address: str
+    # Corporate fields
+    company_name: str
+    rc_number: str
+    business_type: str
+    corp_passport_no: str
+    contact_person: str
+    corp_phone_number: str
+    corp_email: str
+    # Bank details
+    bank_name: str
+    bank_branch: str
+    account_number: str
+    sort_code: str
+    bvn: str
+    # Classification
+    is_resident: bool
+    investor_category: frozenset
+    # Distribution
+    agent_name: str
+    stockbroker_code: str
+    # Witness
+    needs_witness: bool
+    witness_name: str
+    witness_address: str
+    witness_acknowledged: bool
+
+    @classmethod
+    def from_data(cls, data: Dict) -> '_FormFields':
+        """Build the normalized fields from a raw application dictionary"""
+        values = {f.name: _text(data.get(f.name)) for f in fields(cls) if f.type is str}
+        values['applicant_type'] = values['applicant_type'] or 'Individual'
+        values['tenor'] = values['tenor'] or '2-Year'
+        return cls(
+            **values,
+            bond_value=data.get('bond_value') or 0,
+            is_resident=bool(data.get('is_resident', True)),
+            investor_category=frozenset(data.get('investor_category') or ()),
+            needs_witness=bool(data.get('needs_witness', False)),
+            witness_acknowledged=bool(data.get('witness_acknowledged', False)),
+        )
+
 
 class FGNSBTemplate:
     """
     Template for generating FGNSB subscription form matching official DMO styling.
     """
 
+    # Investor categories in the order they appear on the official form
+    _ALL_CATEGORIES = (
+        "Individual", "Insurance", "Corporate", "Others",
+        "*Foreign Investor", "Non-Bank Financial Institution",
+        "Co-operative Society", "Government Agencies",
+        "Staff Scheme", "Micro Finance Bank",
+    )
+
     def __init__(self, data: Dict):
         self.data = data
+        self._d = _FormFields.from_data(data)
+
+        # Section B builder is fixed by the applicant type, so resolve it once
+        applicant_type = self._d.applicant_type
+        if applicant_type == 'Individual':
+            self._build_section_b = self._build_section_b_individual_only
+        elif applicant_type == 'Joint':
+            self._build_section_b = self._build_section_b_individual_with_joint
+        else:
+            self._build_section_b = self._build_section_b_corporate
         self.width, self.height = A4
         self.margin = PDFStyles.PAGE_MARGIN
-        self.content_width = self.width - (2 * self.margin)
+        self.content_width = _CONTENT_WIDTH
 
-        # Get logo path - pdf module is at /app/pdf/, so parent.parent gives /app
-        self.assets_path = Path(__file__).parent.parent / 'assets'
-        self.logo_path = self.assets_path / 'dmo_logo.png'
+        self.assets_path = _ASSETS_PATH
+        self.logo_path = _LOGO_PATH
 
-    def _build_header(self) -> list:
-        """Build the document header with DMO logo and addressing"""
-        elements = []
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _get_logo(cls) -> Optional[ImageReader]:
+        """Open and decode the DMO logo once per process; None if the asset is missing"""
+        if not _LOGO_EXISTS:
+            return None
+        return ImageReader(_LOGO_PATH_STR)
 
+    def _build_header(self) -> Iterator[Flowable]:
+        """Build the document header with DMO logo and addressing"""
         # Create header table with To/Logo/No sections
         header_data = []
 
         # Top row with addressing and logo
-        to_text = Paragraph(
-            "<b>To:</b><br/>Director-General,<br/>Debt Management Office, Abuja",
-            ParagraphStyle('To', fontName='Helvetica', fontSize=8, leading=10)
-        )
+        to_text = _static_para('to')
 
         # Logo in center
-        if self.logo_path.exists():
-            logo = Image(str(self.logo_path), width=60, height=45)
+        logo_image = self._get_logo()
+        if logo_image is not None:
+            logo = LogoImage(logo_image, width=60, height=45)
         else:
-            logo = Paragraph(
-                "<b>DEBT MANAGEMENT OFFICE<br/>NIGERIA</b>",
-                ParagraphStyle('LogoText', fontName='Helvetica-Bold', fontSize=10,
-                              alignment=TA_CENTER, leading=12)
-            )
+            logo = _static_para('logo_text')
 
-        no_text = Paragraph(
-            "<b>No:</b> ____________<br/><br/><i>Official use only</i>",
-            ParagraphStyle('No', fontName='Helvetica', fontSize=8, alignment=TA_RIGHT, leading=10)
-        )
+        no_text = _static_para('no')
 
         header_data.append([to_text, logo, no_text])
 
-        header_table = Table(header_data, colWidths=[self.content_width * 0.3,
-                                                      self.content_width * 0.4,
-                                                      self.content_width * 0.3])
-        header_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-            ('ALIGN', (2, 0), (2, 0), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-        elements.append(header_table)
-        elements.append(Spacer(1, 8))
+        header_table = Table(header_data, colWidths=_HEADER_COLS)
+        header_table.setStyle(_HEADER_STYLE)
+        yield header_table
+        yield Spacer(1, 8)
 
         # Title
-        title_style = ParagraphStyle(
-            'Title',
-            fontName='Helvetica-Bold',
-            fontSize=11,
-            alignment=TA_CENTER,
-            textColor=PDFColors.BLACK,
-            spaceAfter=4,
-        )
-        elements.append(Paragraph(
-            "SUBSCRIPTION FORM FOR FEDERAL GOVERNMENT OF NIGERIA SAVINGS BOND (FGNSB)",
-            title_style
-        ))
+        yield _static_para('title')
 
         # Instructions
-        instruction_style = ParagraphStyle(
-            'Instructions',
-            fontName='Helvetica',
-            fontSize=7,
-            alignment=TA_CENTER,
-            textColor=PDFColors.GRAY,
-            leading=9,
-        )
-        elements.append(Paragraph(
-            "Applications must be made in accordance with the instructions set out on the back of this application form. "
-            "Care must be taken to follow these instructions as applications that do not comply with the instructions may be rejected. "
-            "If you are in any doubt, please consult your Stockbroker, Banker, Solicitor, or any professional adviser for guidance.",
-            instruction_style
-        ))
-        elements.append(Spacer(1, 4))
+        yield _static_para('instructions')
+        yield Spacer(1, 4)
 
         # Declaration line
-        declaration_style = ParagraphStyle(
-            'Declaration',
-            fontName='Helvetica-Oblique',
-            fontSize=8,
-            alignment=TA_CENTER,
-            textColor=PDFColors.BLACK,
-        )
-        elements.append(Paragraph(
-            "In response to the advertisement in both print and electronic media, I/We hereby offer my/our subscription for FGNSB",
-            declaration_style
-        ))
-        elements.append(Spacer(1, 8))
+        yield _static_para('declaration')
+        yield Spacer(1, 8)
 
-        return elements
-
-    def _build_section_a(self) -> list:
+    def _build_section_a(self) -> Iterator[Flowable]:
         """Build Section A: Guide to Applications"""
-        elements = []
-
         # Section header
-        elements.append(SectionHeader("A", "Guide to Applications", width=self.content_width))
-        elements.append(Spacer(1, 4))
+        yield SectionHeader("A", "Guide to Applications", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         # Build the guide section content
-        tenor = self.data.get('tenor', '2-Year')
-        month_of_offer = self.data.get('month_of_offer', '')
-        bond_value = self.data.get('bond_value', 0)
-        amount_words = self.data.get('amount_in_words', '')
+        tenor = self._d.tenor
+        month_of_offer = self._d.month_of_offer
+        bond_value = self._d.bond_value
+        amount_words = self._d.amount_in_words
 
         # Row 1: Tenor and Month
         tenor_2yr = "X" if tenor == "2-Year" else " "
@@ -153,305 +418,169 @@ class FGNSBTemplate:
 
         row1_data = [
             [
-                Paragraph("<b>Tenor of Bond:</b>", PDFStyles.get_body_style()),
-                Paragraph(f"2-Year [{tenor_2yr}]", PDFStyles.get_body_style()),
-                Paragraph(f"3-Year [{tenor_3yr}]", PDFStyles.get_body_style()),
-                Paragraph("<b>Month of Offer:</b>", PDFStyles.get_body_style()),
-                Paragraph(str(month_of_offer), PDFStyles.get_body_style()),
+                "Tenor of Bond:",
+                f"2-Year [{tenor_2yr}]",
+                f"3-Year [{tenor_3yr}]",
+                "Month of Offer:",
+                month_of_offer,
             ]
         ]
         row1_table = Table(row1_data, colWidths=[80, 70, 70, 80, 100])
-        row1_table.setStyle(PDFStyles.get_form_table_style())
-        elements.append(row1_table)
+        row1_table.setStyle(_TENOR_ROW_STYLE)
+        yield row1_table
 
         # Row 2: Values section
         row2_data = [
             [
-                Paragraph("<b>Minimum Value:</b> N5,000.00", PDFStyles.get_body_style()),
-                Paragraph(f"<b>Value of Bonds Applied for:</b> N{bond_value:,.2f}", PDFStyles.get_body_style()),
+                _static_para('minimum_value'),
+                Paragraph(f"<b>Value of Bonds Applied for:</b> N{bond_value:,.2f}", _STYLES['body']),
             ],
             [
-                Paragraph("<b>Maximum Value:</b> N50,000,000.00", PDFStyles.get_body_style()),
-                Paragraph(f"<b>Amount in Words:</b> {amount_words}", PDFStyles.get_body_style()),
+                _static_para('maximum_value'),
+                Paragraph(f"<b>Amount in Words:</b> {amount_words}", _STYLES['body']),
             ]
         ]
-        row2_table = Table(row2_data, colWidths=[self.content_width * 0.4, self.content_width * 0.6])
-        row2_table.setStyle(PDFStyles.get_form_table_style())
-        elements.append(row2_table)
+        row2_table = Table(row2_data, colWidths=_LABEL_VALUE_COLS)
+        row2_table.setStyle(_GUIDE_TABLE_STYLE)
+        yield row2_table
 
         # E-allotment details
-        cscs_number = self.data.get('cscs_number', '')
-        chn_number = self.data.get('chn_number', '')
+        cscs_number = self._d.cscs_number
+        chn_number = self._d.chn_number
 
         eallot_data = [
             ["E-allotment Details", ""],
-            [Paragraph("<b>Applicant's CSCS A/C No.:</b>", PDFStyles.get_body_style()),
-             Paragraph(str(cscs_number), PDFStyles.get_body_style())],
-            [Paragraph("<b>Applicant's CHN No.:</b>", PDFStyles.get_body_style()),
-             Paragraph(str(chn_number), PDFStyles.get_body_style())],
+            ["Applicant's CSCS A/C No.:", cscs_number],
+            ["Applicant's CHN No.:", chn_number],
         ]
-        eallot_table = Table(eallot_data, colWidths=[self.content_width * 0.4, self.content_width * 0.6])
-        eallot_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), PDFColors.DMO_GREEN_LIGHT),
-            ('SPAN', (0, 0), (-1, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elements.append(eallot_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_section_b_individual(self) -> list:
-        """Build Section B for Individual/Joint applicants"""
-        elements = []
-
-        applicant_type = self.data.get('applicant_type', 'Individual')
-        section_title = "1. Individual Applicant Details" if applicant_type == "Individual" else "1. Primary Applicant Details"
-
-        elements.append(SectionHeader("B", section_title, width=self.content_width))
-        elements.append(Spacer(1, 4))
+        eallot_table = Table(eallot_data, colWidths=_LABEL_VALUE_COLS)
+        eallot_table.setStyle(_EALLOT_STYLE)
+        yield eallot_table
+        yield Spacer(1, 8)
+
+    def _build_section_b_individual_only(self) -> Iterator[Flowable]:
+        """Build Section B for Individual applicants"""
+        yield from self._build_individual_details("1. Individual Applicant Details")
+
+    def _build_section_b_individual_with_joint(self) -> Iterator[Flowable]:
+        """Build Section B for Joint applicants (primary plus joint applicant)"""
+        yield from self._build_individual_details("1. Primary Applicant Details")
+        yield from self._build_joint_applicant_section()
+
+    def _build_individual_details(self, section_title: str) -> Iterator[Flowable]:
+        """Build the individual/primary applicant details table"""
+        yield SectionHeader("B", section_title, width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         # Individual details
         details_data = [
-            ["Title:", self.data.get('title', ''), "Full Name:", self.data.get('full_name', '')],
-            ["Date of Birth:", self.data.get('date_of_birth', ''), "Phone Number:", self.data.get('phone_number', '')],
-            ["Occupation:", self.data.get('occupation', ''), "Passport No:", self.data.get('passport_no', '')],
-            ["Next of Kin:", self.data.get('next_of_kin', ''), "Mother's Maiden Name:", self.data.get('mothers_maiden_name', '')],
-            ["Address:", self.data.get('address', ''), "Email:", self.data.get('email', '')],
+            ["Title:", self._d.title, "Full Name:", self._d.full_name],
+            ["Date of Birth:", self._d.date_of_birth, "Phone Number:", self._d.phone_number],
+            ["Occupation:", self._d.occupation, "Passport No:", self._d.passport_no],
+            ["Next of Kin:", self._d.next_of_kin, "Mother's Maiden Name:", self._d.mothers_maiden_name],
+            ["Address:", self._d.address, "Email:", self._d.email],
         ]
 
         details_table = Table(details_data, colWidths=[70, 130, 80, 130])
-        details_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTNAME', (3, 0), (3, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-            ('BACKGROUND', (2, 0), (2, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(details_table)
-        elements.append(Spacer(1, 8))
-
-        # Joint applicant section if applicable
-        if applicant_type == "Joint":
-            elements.extend(self._build_joint_applicant_section())
-
-        return elements
-
-    def _build_joint_applicant_section(self) -> list:
-        """Build joint applicant details section"""
-        elements = []
+        details_table.setStyle(_FORM_TABLE_STYLE)
+        yield details_table
+        yield Spacer(1, 8)
 
-        elements.append(SectionHeader("", "2. Joint Applicant Details", width=self.content_width))
-        elements.append(Spacer(1, 4))
+    def _build_joint_applicant_section(self) -> Iterator[Flowable]:
+        """Build joint applicant details section"""
+        yield SectionHeader("", "2. Joint Applicant Details", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         joint_data = [
-            ["Title:", self.data.get('joint_title', ''), "Full Name:", self.data.get('joint_full_name', '')],
-            ["Phone Number:", self.data.get('joint_phone_number', ''), "Email:", self.data.get('joint_email', '')],
-            ["Occupation:", self.data.get('joint_occupation', ''), "Passport No:", self.data.get('joint_passport_no', '')],
-            ["Next of Kin:", self.data.get('joint_next_of_kin', ''), "Address:", self.data.get('joint_address', '')],
+            ["Title:", self._d.joint_title, "Full Name:", self._d.joint_full_name],
+            ["Phone Number:", self._d.joint_phone_number, "Email:", self._d.joint_email],
+            ["Occupation:", self._d.joint_occupation, "Passport No:", self._d.joint_passport_no],
+            ["Next of Kin:", self._d.joint_next_of_kin, "Address:", self._d.joint_address],
         ]
 
         joint_table = Table(joint_data, colWidths=[70, 130, 80, 130])
-        joint_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-            ('BACKGROUND', (2, 0), (2, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(joint_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_section_b_corporate(self) -> list:
-        """Build Section B for Corporate applicants"""
-        elements = []
+        joint_table.setStyle(_FORM_TABLE_STYLE)
+        yield joint_table
+        yield Spacer(1, 8)
 
-        elements.append(SectionHeader("B", "Corporate Applicant Details", width=self.content_width))
-        elements.append(Spacer(1, 4))
+    def _build_section_b_corporate(self) -> Iterator[Flowable]:
+        """Build Section B for Corporate applicants"""
+        yield SectionHeader("B", "Corporate Applicant Details", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         corp_data = [
-            ["Company Name:", self.data.get('company_name', ''), "R/C No:", self.data.get('rc_number', '')],
-            ["Type of Business:", self.data.get('business_type', ''), "Passport No:", self.data.get('corp_passport_no', '')],
-            ["Contact Person:", self.data.get('contact_person', ''), "Phone No:", self.data.get('corp_phone_number', '')],
-            ["Address:", self.data.get('address', ''), "Email:", self.data.get('corp_email', '')],
+            ["Company Name:", self._d.company_name, "R/C No:", self._d.rc_number],
+            ["Type of Business:", self._d.business_type, "Passport No:", self._d.corp_passport_no],
+            ["Contact Person:", self._d.contact_person, "Phone No:", self._d.corp_phone_number],
+            ["Address:", self._d.address, "Email:", self._d.corp_email],
         ]
 
         corp_table = Table(corp_data, colWidths=[80, 150, 60, 120])
-        corp_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-            ('BACKGROUND', (2, 0), (2, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(corp_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_section_c(self) -> list:
-        """Build Section C: Bank Details"""
-        elements = []
+        corp_table.setStyle(_FORM_TABLE_STYLE)
+        yield corp_table
+        yield Spacer(1, 8)
 
-        elements.append(SectionHeader("C", "Bank Details", width=self.content_width))
-        elements.append(Spacer(1, 4))
+    def _build_section_c(self) -> Iterator[Flowable]:
+        """Build Section C: Bank Details"""
+        yield SectionHeader("C", "Bank Details", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         bank_data = [
-            ["Bank Name:", self.data.get('bank_name', ''), "Bank Branch:", self.data.get('bank_branch', '')],
-            ["Account Number:", self.data.get('account_number', ''), "Sort Code:", self.data.get('sort_code', '')],
-            ["BVN:", self.data.get('bvn', ''), "", ""],
+            ["Bank Name:", self._d.bank_name, "Bank Branch:", self._d.bank_branch],
+            ["Account Number:", self._d.account_number, "Sort Code:", self._d.sort_code],
+            ["BVN:", self._d.bvn, "", ""],
         ]
 
         bank_table = Table(bank_data, colWidths=[80, 150, 70, 110])
-        bank_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-            ('BACKGROUND', (2, 0), (2, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(bank_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_residency_section(self) -> list:
-        """Build Residency Classification section"""
-        elements = []
+        bank_table.setStyle(_FORM_TABLE_STYLE)
+        yield bank_table
+        yield Spacer(1, 8)
 
-        is_resident = self.data.get('is_resident', True)
+    def _build_residency_section(self) -> Iterator[Flowable]:
+        """Build Residency Classification section"""
+        is_resident = self._d.is_resident
         resident_check = "X" if is_resident else " "
         non_resident_check = " " if is_resident else "X"
 
-        residency_style = ParagraphStyle(
-            'Residency',
-            fontName='Helvetica-Bold',
-            fontSize=9,
-            alignment=TA_LEFT,
-        )
-
         residency_data = [
             [
-                Paragraph("<b>Residency Classification of Applicant (tick the Appropriate box):</b>", residency_style),
-                Paragraph(f"Resident [{resident_check}]", PDFStyles.get_body_style()),
-                Paragraph(f"Non-Resident [{non_resident_check}]", PDFStyles.get_body_style()),
+                _static_para('residency'),
+                f"Resident [{resident_check}]",
+                f"Non-Resident [{non_resident_check}]",
             ]
         ]
 
         residency_table = Table(residency_data, colWidths=[250, 80, 80])
-        residency_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        elements.append(residency_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_investor_category_section(self) -> list:
-        """Build Investor Category section"""
-        elements = []
+        residency_table.setStyle(_RESIDENCY_STYLE)
+        yield residency_table
+        yield Spacer(1, 8)
 
-        investor_categories = self.data.get('investor_category', [])
-
-        # Define all available categories
-        all_categories = [
-            "Individual", "Insurance", "Corporate", "Others",
-            "*Foreign Investor", "Non-Bank Financial Institution",
-            "Co-operative Society", "Government Agencies",
-            "Staff Scheme", "Micro Finance Bank"
-        ]
-
-        category_style = ParagraphStyle(
-            'Category',
-            fontName='Helvetica-Bold',
-            fontSize=9,
-            alignment=TA_LEFT,
-        )
+    def _build_investor_category_section(self) -> Iterator[Flowable]:
+        """Build Investor Category section"""
+        checked_set = self._d.investor_category
 
-        # Build header
-        header_data = [[Paragraph("<b>Investor Category (tick all that apply):</b>", category_style)]]
-        header_table = Table(header_data, colWidths=[self.content_width])
-        header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), PDFColors.DMO_GREEN_LIGHT),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elements.append(header_table)
+        # Header row is static text; bold face comes from the table style
+        header_table = Table([[_CATEGORY_HEADER_TEXT]], colWidths=[_CONTENT_WIDTH])
+        header_table.setStyle(_CATEGORY_HEADER_STYLE)
+        yield header_table
 
         # Build category checkboxes in 2 columns
-        cat_rows = []
-        for i in range(0, len(all_categories), 2):
-            row = []
-            for j in range(2):
-                if i + j < len(all_categories):
-                    cat = all_categories[i + j]
-                    checked = "X" if cat in investor_categories else " "
-                    row.append(Paragraph(f"[{checked}] {cat}", PDFStyles.get_body_style()))
-                else:
-                    row.append("")
-            cat_rows.append(row)
-
-        cat_table = Table(cat_rows, colWidths=[self.content_width * 0.5, self.content_width * 0.5])
-        cat_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        elements.append(cat_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_witness_section(self) -> list:
-        """Build Witness Section for illiterate applicants"""
-        elements = []
-
-        needs_witness = self.data.get('needs_witness', False)
-
-        if not needs_witness:
-            return elements
-
-        elements.append(SectionHeader("", "Witness Section (for applicants who cannot sign)", width=self.content_width))
-        elements.append(Spacer(1, 4))
-
-        witness_name = self.data.get('witness_name', '')
-        witness_address = self.data.get('witness_address', '')
-        witness_acknowledged = self.data.get('witness_acknowledged', False)
+        cells = [f"[X] {cat}" if cat in checked_set else f"[ ] {cat}" for cat in self._ALL_CATEGORIES]
+        cat_rows = [cells[i:i + 2] for i in range(0, len(cells), 2)]
+
+        cat_table = Table(cat_rows, colWidths=_HALF_COLS)
+        cat_table.setStyle(_CATEGORY_STYLE)
+        yield cat_table
+        yield Spacer(1, 8)
+
+    def _build_witness_section(self) -> Iterator[Flowable]:
+        """Build Witness Section for illiterate applicants (only called when needed)"""
+        yield SectionHeader("", "Witness Section (for applicants who cannot sign)", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
+
+        witness_name = self._d.witness_name
+        witness_address = self._d.witness_address
+        witness_acknowledged = self._d.witness_acknowledged
         ack_check = "X" if witness_acknowledged else " "
 
         witness_data = [
@@ -460,159 +589,97 @@ class FGNSBTemplate:
             ["Acknowledgment:", f"[{ack_check}] I confirm that I have witnessed this application and the thumbprint belongs to the applicant"],
         ]
 
-        witness_table = Table(witness_data, colWidths=[100, self.content_width - 100])
-        witness_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(witness_table)
+        witness_table = Table(witness_data, colWidths=_WITNESS_COLS)
+        witness_table.setStyle(_LABEL_TABLE_STYLE)
+        yield witness_table
 
         # Thumbprint area
-        thumb_style = ParagraphStyle('Thumb', fontName='Helvetica', fontSize=8, alignment=TA_CENTER)
         thumb_data = [
             [
-                Paragraph("Witness Signature: _______________________", thumb_style),
-                Paragraph("<b>Applicant's Thumbprint</b><br/><br/><br/><br/><br/>", thumb_style),
+                _static_para('witness_signature'),
+                _static_para('thumbprint'),
             ]
         ]
-        thumb_table = Table(thumb_data, colWidths=[self.content_width * 0.5, self.content_width * 0.5])
-        thumb_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ]))
-        elements.append(thumb_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_section_d(self) -> list:
-        """Build Section D: Distribution Agents"""
-        elements = []
+        thumb_table = Table(thumb_data, colWidths=_HALF_COLS)
+        thumb_table.setStyle(_THUMB_STYLE)
+        yield thumb_table
+        yield Spacer(1, 8)
 
-        elements.append(SectionHeader("D", "Distribution Agents", width=self.content_width))
-        elements.append(Spacer(1, 4))
+    def _build_section_d(self) -> Iterator[Flowable]:
+        """Build Section D: Distribution Agents"""
+        yield SectionHeader("D", "Distribution Agents", width=_CONTENT_WIDTH)
+        yield Spacer(1, 4)
 
         agent_data = [
-            ["Name of Distribution Agent:", self.data.get('agent_name', '')],
-            ["Stockbroker Code:", self.data.get('stockbroker_code', '')],
+            ["Name of Distribution Agent:", self._d.agent_name],
+            ["Stockbroker Code:", self._d.stockbroker_code],
         ]
 
         agent_table = Table(agent_data, colWidths=[150, 260])
-        agent_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 0), (0, -1), PDFColors.LIGHT_GRAY),
-        ]))
-        elements.append(agent_table)
-        elements.append(Spacer(1, 8))
-
-        return elements
-
-    def _build_signature_section(self) -> list:
-        """Build signature and stamp section"""
-        elements = []
+        agent_table.setStyle(_LABEL_TABLE_STYLE)
+        yield agent_table
+        yield Spacer(1, 8)
 
+    def _build_signature_section(self) -> Iterator[Flowable]:
+        """Build signature and stamp section"""
         # Create a table with signature lines and stamp area
-        sig_style = ParagraphStyle('Sig', fontName='Helvetica', fontSize=8, leading=10)
-
         sig_data = [
             [
-                Paragraph("Usual Signature: _______________________<br/><br/>Date: _______________", sig_style),
-                Paragraph("<b>Stamp of Receiving Agent</b>", sig_style),
+                _static_para('signature'),
+                _static_para('stamp'),
             ]
         ]
 
-        sig_table = Table(sig_data, colWidths=[self.content_width * 0.5, self.content_width * 0.5])
-        sig_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.DMO_GREEN),
-            ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-        ]))
-        elements.append(sig_table)
-
-        return elements
+        sig_table = Table(sig_data, colWidths=_HALF_COLS)
+        sig_table.setStyle(_SIG_STYLE)
+        yield sig_table
 
-    def _build_footer(self) -> list:
+    def _build_footer(self, timestamp: Optional[str] = None) -> Iterator[Flowable]:
         """Build document footer with generation timestamp"""
-        elements = []
-        elements.append(Spacer(1, 12))
-
-        footer_style = ParagraphStyle(
-            'Footer',
-            fontName='Helvetica',
-            fontSize=7,
-            textColor=PDFColors.GRAY,
-            alignment=TA_CENTER,
-        )
+        yield Spacer(1, 12)
 
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        elements.append(Paragraph(
+        if timestamp is None:
+            timestamp = format_timestamp()
+        yield Paragraph(
             f"Generated on: {timestamp}",
-            footer_style
-        ))
-
-        return elements
-
-    def build_document(self) -> list:
-        """Build the complete document"""
-        elements = []
-
-        # Header
-        elements.extend(self._build_header())
-
-        # Section A: Guide to Applications
-        elements.extend(self._build_section_a())
-
-        # Section B: Applicant Details (conditional on type)
-        applicant_type = self.data.get('applicant_type', 'Individual')
-        if applicant_type in ['Individual', 'Joint']:
-            elements.extend(self._build_section_b_individual())
-        else:
-            elements.extend(self._build_section_b_corporate())
-
-        # Section C: Bank Details
-        elements.extend(self._build_section_c())
-
-        # Residency Classification
-        elements.extend(self._build_residency_section())
+            _STYLES['footer']
+        )
 
-        # Investor Category
-        elements.extend(self._build_investor_category_section())
+    def build_document(self, timestamp: Optional[str] = None) -> list:
+        """
+        Build the complete document.
 
-        # Section D: Distribution Agents
-        elements.extend(self._build_section_d())
+        Args:
+            timestamp: Pre-formatted footer timestamp, e.g. shared across a batch.
+                       Defaults to the current time.
+        """
+        sections = [
+            self._build_header(),
+            self._build_section_a(),
+            self._build_section_b(),
+            self._build_section_c(),
+            self._build_residency_section(),
+            self._build_investor_category_section(),
+            self._build_section_d(),
+        ]
 
         # Witness Section (if applicable)
-        elements.extend(self._build_witness_section())
-
-        # Signature Section
-        elements.extend(self._build_signature_section())
+        if self._d.needs_witness:
+            sections.append(self._build_witness_section())
 
-        # Footer
-        elements.extend(self._build_footer())
+        sections.append(self._build_signature_section())
+        sections.append(self._build_footer(timestamp))
 
-        return elements
+        # Each section yields its flowables straight into one list
+        return list(chain.from_iterable(sections))
 
-    def generate(self, output_path: str) -> bool:
+    def generate(self, output_path: str, timestamp: Optional[str] = None) -> bool:
         """
         Generate the PDF document.
 
         Args:
             output_path: Path where the PDF will be saved
+            timestamp: Optional pre-formatted footer timestamp
 
         Returns:
             True if successful, False otherwise
@@ -627,7 +694,7 @@ class FGNSBTemplate:
                 bottomMargin=self.margin,
             )
 
-            elements = self.build_document()
+            elements = self.build_document(timestamp)
             doc.build(elements)
             return True
 
@@ -1,20 +1,44 @@
 """
 Pytest configuration and fixtures for backend tests.
+
+FastAPI, SQLAlchemy and the app are imported inside the fixtures that need
+them, so modules that only test schemas don't pay for the API stack.
 """
 
+from __future__ import annotations
+
+import json
 import os
-from typing import Generator
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generator
 
-import bcrypt
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-# Generate password hash dynamically for test user
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import Engine
+    from sqlalchemy.orm import Session
+
+# Precomputed bcrypt hash of TEST_PASSWORD at the minimum cost (4), so importing
+# the suite hashes nothing and every checkpw at login stays cheap. Regenerate with
+# bcrypt.hashpw(b"testpass", bcrypt.gensalt(rounds=4)) if the password changes.
 TEST_PASSWORD = "testpass"
-TEST_PASSWORD_HASH = bcrypt.hashpw(TEST_PASSWORD.encode(), bcrypt.gensalt()).decode()
+TEST_PASSWORD_HASH = "$2b$04$T2M1xK3VWpN8k5eu7PtBL.ei7k7QlWXUeYh5MIVa5UCDtBqagaxF6"
+
+# Content type for request bodies posted pre-serialized via ``content=``
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Named shared-cache in-memory database, so every connection sees one schema;
+# keyed on the pytest-xdist worker so parallel workers never share it
+TEST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = (
+    f"sqlite:///file:fgnsb_test_{TEST_WORKER}?mode=memory&cache=shared&uri=true"
+)
 
 # Set test environment before importing app
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
@@ -22,39 +46,113 @@ os.environ["ADMIN_USERNAME"] = "testadmin"
 os.environ["ADMIN_PASSWORD_HASH"] = TEST_PASSWORD_HASH
 os.environ["JWT_SECRET_KEY"] = "test-secret-key-for-testing-only"
 
-from app.database import Base, get_db
-from app.main import app
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add --runslow to opt in to tests marked slow."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip tests marked slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    """Create the test engine and schema once for the whole session."""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+
+    import app.models  # noqa: F401  (registers the tables on Base.metadata)
+    from app.database import Base
 
-@pytest.fixture(scope="function")
-def db() -> Generator[Session, None, None]:
-    """Create a fresh database for each test."""
-    # Create a new engine for each test to ensure complete isolation
     engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False, "uri": True},
         poolclass=StaticPool,
     )
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # pysqlite defers BEGIN itself, which breaks SAVEPOINT; emit it explicitly
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    # Create session
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = TestSessionLocal()
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
 
     try:
-        yield db
+        yield engine
     finally:
-        db.close()
-        # Clean up
-        Base.metadata.drop_all(bind=engine)
         engine.dispose()
 
 
+@contextmanager
+def _rolled_back_session(engine: Engine) -> Iterator[Session]:
+    """Yield a session whose work is discarded when the block exits."""
+    from sqlalchemy.orm import Session
+
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Commits in the code under test release a SAVEPOINT instead of the
+    # outer transaction, so the rollback below discards everything.
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
 @pytest.fixture(scope="function")
-def client(db: Session) -> Generator[TestClient, None, None]:
+def db(engine: Engine) -> Generator[Session, None, None]:
+    """Run each test inside a transaction that is rolled back afterwards."""
+    with _rolled_back_session(engine) as db:
+        yield db
+
+
+@pytest.fixture(scope="session")
+def app_instance() -> FastAPI:
+    """The application under test, imported once for the session."""
+    import app.main
+
+    return app.main.app
+
+
+@pytest.fixture(scope="session")
+def _test_client(app_instance: FastAPI) -> Generator[TestClient, None, None]:
+    """Run the app lifespan once and share the client across the session."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_instance) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(
+    app_instance: FastAPI, _test_client: TestClient, db: Session
+) -> Generator[TestClient, None, None]:
     """Create a test client with database dependency override."""
+    from app.database import get_db
 
     def override_get_db():
         try:
@@ -62,137 +160,256 @@ def client(db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    # Restore rather than clear, so overrides set outside this test survive
+    saved_overrides = dict(app_instance.dependency_overrides)
+    app_instance.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    try:
+        yield _test_client
+    finally:
+        app_instance.dependency_overrides.clear()
+        app_instance.dependency_overrides.update(saved_overrides)
+        _test_client.cookies.clear()
 
-    app.dependency_overrides.clear()
 
+@pytest.fixture(scope="session")
+def _admin_token() -> str:
+    """Mint one admin JWT per session instead of logging in through the API."""
+    from app.routers.auth import create_access_token
 
-@pytest.fixture
-def auth_headers(client: TestClient) -> dict:
-    """Get authentication headers for admin user."""
-    # Login and get token
-    response = client.post(
-        "/api/auth/login",
-        data={"username": "testadmin", "password": "testpass"},
+    return create_access_token(
+        data={"sub": "testadmin"}, expires_delta=timedelta(days=1)
     )
 
-    if response.status_code != 200:
-        # If login fails, the password hash might not match
-        pytest.skip("Auth not configured properly for tests")
 
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+@pytest.fixture(scope="session")
+def auth_headers(_admin_token: str) -> dict:
+    """Get authentication headers for admin user."""
+    return {"Authorization": f"Bearer {_admin_token}"}
+
 
+@pytest.fixture(scope="session")
+def json_headers() -> dict:
+    """Headers for request bodies posted pre-serialized via ``content=``."""
+    return JSON_HEADERS
 
-@pytest.fixture
-def sample_individual_application() -> dict:
+
+@pytest.fixture(scope="session")
+def _authed_test_client(
+    app_instance: FastAPI, auth_headers: dict
+) -> Generator[TestClient, None, None]:
+    """A second shared client that sends the admin headers on every request."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_instance, headers=auth_headers) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def authed_client(
+    client: TestClient, _authed_test_client: TestClient
+) -> Generator[TestClient, None, None]:
+    """Create an admin-authenticated client sharing the client fixture's database."""
+    try:
+        yield _authed_test_client
+    finally:
+        _authed_test_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def sample_individual_application() -> Mapping[str, Any]:
     """Sample Individual application data."""
-    return {
-        "tenor": "2-Year",
-        "month_of_offer": "January",
-        "bond_value": 100000,
-        "amount_in_words": "One Hundred Thousand Naira Only",
-        "applicant_type": "Individual",
-        "title": "Mr.",
-        "full_name": "John Doe",
-        "date_of_birth": "1990-01-15",
-        "phone_number": "+2348012345678",
-        "email": "john.doe@example.com",
-        "occupation": "Engineer",
-        "address": "123 Test Street, Lagos",
-        "bank_name": "Access Bank",
-        "bank_branch": "Lagos Main",
-        "account_number": "0123456789",
-        "sort_code": "044",
-        "bvn": "12345678901",
-        "is_resident": True,
-        "investor_category": ["Retail Investor"],
-    }
+    return MappingProxyType(
+        {
+            "tenor": "2-Year",
+            "month_of_offer": "January",
+            "bond_value": 100000,
+            "amount_in_words": "One Hundred Thousand Naira Only",
+            "applicant_type": "Individual",
+            "title": "Mr.",
+            "full_name": "John Doe",
+            "date_of_birth": "1990-01-15",
+            "phone_number": "+2348012345678",
+            "email": "john.doe@example.com",
+            "occupation": "Engineer",
+            "address": "123 Test Street, Lagos",
+            "bank_name": "Access Bank",
+            "bank_branch": "Lagos Main",
+            "account_number": "0123456789",
+            "sort_code": "044",
+            "bvn": "12345678901",
+            "is_resident": True,
+            "investor_category": ("Retail Investor",),
+        }
+    )
 
 
-@pytest.fixture
-def sample_joint_application() -> dict:
+@pytest.fixture(scope="session")
+def sample_joint_application() -> Mapping[str, Any]:
     """Sample Joint application data."""
-    return {
-        "tenor": "3-Year",
-        "month_of_offer": "February",
-        "bond_value": 250000,
-        "amount_in_words": "Two Hundred and Fifty Thousand Naira Only",
-        "applicant_type": "Joint",
-        "title": "Mr.",
-        "full_name": "John Doe",
-        "date_of_birth": "1985-06-20",
-        "phone_number": "+2348012345678",
-        "email": "john.doe@example.com",
-        "occupation": "Doctor",
-        "address": "456 Test Avenue, Abuja",
-        "bank_name": "First Bank",
-        "bank_branch": "Abuja Central",
-        "account_number": "1234567890",
-        "sort_code": "011",
-        "bvn": "12345678901",
-        "joint_title": "Mrs.",
-        "joint_full_name": "Jane Doe",
-        "joint_date_of_birth": "1988-03-10",
-        "joint_phone_number": "+2348087654321",
-        "joint_email": "jane.doe@example.com",
-        "joint_occupation": "Nurse",
-        "joint_address": "456 Test Avenue, Abuja",
-        "joint_bank_name": "GTBank",
-        "joint_bank_branch": "Abuja Main",
-        "joint_account_number": "0987654321",
-        "joint_sort_code": "058",
-        "joint_bvn": "10987654321",
-        "is_resident": True,
-        "investor_category": ["Retail Investor"],
-    }
+    return MappingProxyType(
+        {
+            "tenor": "3-Year",
+            "month_of_offer": "February",
+            "bond_value": 250000,
+            "amount_in_words": "Two Hundred and Fifty Thousand Naira Only",
+            "applicant_type": "Joint",
+            "title": "Mr.",
+            "full_name": "John Doe",
+            "date_of_birth": "1985-06-20",
+            "phone_number": "+2348012345678",
+            "email": "john.doe@example.com",
+            "occupation": "Doctor",
+            "address": "456 Test Avenue, Abuja",
+            "bank_name": "First Bank",
+            "bank_branch": "Abuja Central",
+            "account_number": "1234567890",
+            "sort_code": "011",
+            "bvn": "12345678901",
+            "joint_title": "Mrs.",
+            "joint_full_name": "Jane Doe",
+            "joint_date_of_birth": "1988-03-10",
+            "joint_phone_number": "+2348087654321",
+            "joint_email": "jane.doe@example.com",
+            "joint_occupation": "Nurse",
+            "joint_address": "456 Test Avenue, Abuja",
+            "joint_bank_name": "GTBank",
+            "joint_bank_branch": "Abuja Main",
+            "joint_account_number": "0987654321",
+            "joint_sort_code": "058",
+            "joint_bvn": "10987654321",
+            "is_resident": True,
+            "investor_category": ("Retail Investor",),
+        }
+    )
 
 
-@pytest.fixture
-def sample_corporate_application() -> dict:
+@pytest.fixture(scope="session")
+def sample_corporate_application() -> Mapping[str, Any]:
     """Sample Corporate application data."""
-    return {
-        "tenor": "2-Year",
-        "month_of_offer": "March",
-        "bond_value": 5000000,
-        "amount_in_words": "Five Million Naira Only",
-        "applicant_type": "Corporate",
-        "company_name": "Test Company Ltd",
-        "rc_number": "RC123456",
-        "business_type": "Technology",
-        "contact_person": "Jane Smith",
-        "corp_phone_number": "+2348012345678",
-        "corp_email": "info@testcompany.com",
-        "corp_address": "789 Business Park, Lagos",
-        "bank_name": "Zenith Bank",
-        "bank_branch": "Victoria Island",
-        "account_number": "1122334455",
-        "sort_code": "057",
-        "bvn": "11223344556",
-        "is_resident": True,
-        "investor_category": ["Institutional Investor"],
-    }
+    return MappingProxyType(
+        {
+            "tenor": "2-Year",
+            "month_of_offer": "March",
+            "bond_value": 5000000,
+            "amount_in_words": "Five Million Naira Only",
+            "applicant_type": "Corporate",
+            "company_name": "Test Company Ltd",
+            "rc_number": "RC123456",
+            "business_type": "Technology",
+            "contact_person": "Jane Smith",
+            "corp_phone_number": "+2348012345678",
+            "corp_email": "info@testcompany.com",
+            "corp_address": "789 Business Park, Lagos",
+            "bank_name": "Zenith Bank",
+            "bank_branch": "Victoria Island",
+            "account_number": "1122334455",
+            "sort_code": "057",
+            "bvn": "11223344556",
+            "is_resident": True,
+            "investor_category": ("Institutional Investor",),
+        }
+    )
 
 
-@pytest.fixture
-def sample_payment() -> dict:
+@pytest.fixture(scope="session")
+def sample_payment() -> Mapping[str, Any]:
     """Sample payment data."""
-    return {
-        "amount": 100000,
-        "payment_method": "bank_transfer",
-        "payment_reference": "TRF123456789",
-        "payment_date": "2026-01-15",
-        "receiving_bank": "Access Bank",
-        "notes": "Test payment",
-    }
+    return MappingProxyType(
+        {
+            "amount": 100000,
+            "payment_method": "bank_transfer",
+            "payment_reference": "TRF123456789",
+            "payment_date": "2026-01-15",
+            "receiving_bank": "Access Bank",
+            "notes": "Test payment",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_individual_json(sample_individual_application: Mapping[str, Any]) -> bytes:
+    """Sample Individual application, serialized once for request bodies."""
+    return json.dumps(dict(sample_individual_application)).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_joint_json(sample_joint_application: Mapping[str, Any]) -> bytes:
+    """Sample Joint application, serialized once for request bodies."""
+    return json.dumps(dict(sample_joint_application)).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_corporate_json(sample_corporate_application: Mapping[str, Any]) -> bytes:
+    """Sample Corporate application, serialized once for request bodies."""
+    return json.dumps(dict(sample_corporate_application)).encode()
 
 
 @pytest.fixture
-def created_application(client: TestClient, sample_individual_application: dict) -> dict:
+def created_application(client: TestClient, sample_individual_json: bytes) -> dict:
     """Create an application and return its data with ID."""
-    response = client.post("/api/applications", json=sample_individual_application)
+    response = client.post(
+        "/api/applications", content=sample_individual_json, headers=JSON_HEADERS
+    )
     assert response.status_code == 201
     return response.json()
+
+
+@pytest.fixture
+def seed_applications(
+    db: Session, sample_individual_application: Mapping[str, Any]
+) -> Callable[..., None]:
+    """Return a helper that inserts applications directly, bypassing the API.
+
+    Each positional mapping overrides fields of the sample Individual
+    application; rows still pass through ApplicationCreate so they match
+    what the endpoint would store.
+    """
+    from sqlalchemy import insert
+
+    from app.models import Application
+    from app.schemas.application import ApplicationCreate
+
+    def _seed(*overrides: Mapping[str, Any]) -> None:
+        db.execute(
+            insert(Application),
+            [
+                ApplicationCreate(
+                    **{**sample_individual_application, **override}
+                ).model_dump()
+                for override in overrides
+            ],
+        )
+        db.commit()
+
+    return _seed
+
+
+@pytest.fixture
+def recorded_payment(
+    client: TestClient,
+    auth_headers: dict,
+    created_application: dict,
+    sample_payment: Mapping[str, Any],
+) -> dict:
+    """Record a pending payment and return its ID with the application's."""
+    app_id = created_application["id"]
+    response = client.post(
+        f"/api/admin/applications/{app_id}/payment",
+        json=dict(sample_payment),
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    return {"id": response.json()["id"], "app_id": app_id}
+
+
+@pytest.fixture
+def stub_pdf(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Serve a minimal PDF from the download endpoint instead of rendering one."""
+    pdf_path = tmp_path / "stub.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    monkeypatch.setattr(
+        "app.routers.applications.generate_application_pdf",
+        lambda application: str(pdf_path),
+    )
+    return pdf_path
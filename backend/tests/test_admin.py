@@ -2,32 +2,27 @@
 Tests for admin dashboard endpoints.
 """
 
-import pytest
+from collections.abc import Callable
+
 from fastapi.testclient import TestClient
 
 
 class TestListApplications:
     """Tests for listing applications with filters."""
 
-    def test_list_applications_empty(self, client: TestClient, auth_headers: dict):
+    def test_list_applications_empty(self, authed_client: TestClient):
         """Test listing applications when none exist."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/applications", headers=auth_headers)
+        response = authed_client.get("/api/admin/applications")
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 0
         assert data["items"] == []
 
     def test_list_applications_with_data(
-        self, client: TestClient, auth_headers: dict, created_application: dict
+        self, authed_client: TestClient, created_application: dict
     ):
         """Test listing applications returns data."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/applications", headers=auth_headers)
+        response = authed_client.get("/api/admin/applications")
         assert response.status_code == 200
         data = response.json()
         assert data["total"] >= 1
@@ -35,124 +30,134 @@ class TestListApplications:
 
     def test_list_applications_pagination(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test pagination parameters work correctly."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        # Create multiple applications
-        for i in range(5):
-            app_data = sample_individual_application.copy()
-            app_data["email"] = f"test{i}@example.com"
-            client.post("/api/applications", json=app_data)
+        # Create multiple applications directly, bypassing the HTTP layer
+        seed_applications(*({"email": f"test{i}@example.com"} for i in range(5)))
 
         # Test page size (minimum page_size is 10)
-        response = client.get(
-            "/api/admin/applications?page=0&page_size=10", headers=auth_headers
-        )
+        response = authed_client.get("/api/admin/applications?page=0&page_size=10")
         assert response.status_code == 200
         data = response.json()
         assert len(data["items"]) <= 10
+        assert data["total"] == 5
         assert data["page"] == 0
         assert data["page_size"] == 10
 
     def test_filter_by_applicant_type(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
-        sample_corporate_application: dict,
+        authed_client: TestClient,
+        sample_individual_json: bytes,
+        sample_corporate_json: bytes,
+        json_headers: dict,
     ):
         """Test filtering by applicant type."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create Individual and Corporate applications
-        client.post("/api/applications", json=sample_individual_application)
-        client.post("/api/applications", json=sample_corporate_application)
+        authed_client.post(
+            "/api/applications", content=sample_individual_json, headers=json_headers
+        )
+        authed_client.post(
+            "/api/applications", content=sample_corporate_json, headers=json_headers
+        )
 
         # Filter by Individual
-        response = client.get(
-            "/api/admin/applications?applicant_types=Individual", headers=auth_headers
+        response = authed_client.get(
+            "/api/admin/applications?applicant_types=Individual"
         )
         assert response.status_code == 200
         data = response.json()
         for item in data["items"]:
             assert item["applicant_type"] == "Individual"
 
+    def test_filter_by_date_range_includes_end_day(
+        self,
+        authed_client: TestClient,
+        seed_applications: Callable,
+    ):
+        """Test a bare end date keeps applications submitted later that day."""
+        seed_applications(
+            {"submission_date": "2026-01-01 08:00:00 WAT"},
+            {"submission_date": "2026-01-31 16:45:00 WAT"},
+            {"submission_date": "2026-02-01 00:00:00 WAT"},
+        )
+
+        response = authed_client.get(
+            "/api/admin/applications?start_date=2026-01-01&end_date=2026-01-31"
+        )
+        assert response.status_code == 200
+        dates = sorted(item["submission_date"] for item in response.json()["items"])
+        assert dates == ["2026-01-01 08:00:00 WAT", "2026-01-31 16:45:00 WAT"]
+
     def test_filter_by_tenor(
-        self, client: TestClient, auth_headers: dict, sample_individual_application: dict
+        self,
+        authed_client: TestClient,
+        sample_individual_json: bytes,
+        json_headers: dict,
     ):
         """Test filtering by tenor."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application with specific tenor
-        client.post("/api/applications", json=sample_individual_application)
-
-        response = client.get(
-            "/api/admin/applications?tenors=2-Year", headers=auth_headers
+        authed_client.post(
+            "/api/applications", content=sample_individual_json, headers=json_headers
         )
+
+        response = authed_client.get("/api/admin/applications?tenors=2-Year")
         assert response.status_code == 200
         data = response.json()
         for item in data["items"]:
             assert item["tenor"] == "2-Year"
 
     def test_filter_by_payment_status(
-        self, client: TestClient, auth_headers: dict, created_application: dict
+        self, authed_client: TestClient, created_application: dict
     ):
         """Test filtering by payment status."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get(
-            "/api/admin/applications?payment_status=pending", headers=auth_headers
-        )
+        response = authed_client.get("/api/admin/applications?payment_status=pending")
         assert response.status_code == 200
         data = response.json()
         for item in data["items"]:
             assert item["payment_status"] == "pending"
 
-    def test_search_by_name(
-        self, client: TestClient, auth_headers: dict, created_application: dict
-    ):
+    def test_search_by_name(self, authed_client: TestClient, created_application: dict):
         """Test searching by applicant name."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get(
-            "/api/admin/applications?search=John", headers=auth_headers
-        )
+        response = authed_client.get("/api/admin/applications?search=John")
         assert response.status_code == 200
         data = response.json()
         assert data["total"] >= 1
 
+    def test_search_treats_wildcards_literally(
+        self, authed_client: TestClient, seed_applications: Callable
+    ):
+        """Test LIKE wildcards in the search term are not expanded."""
+        seed_applications(
+            {"email": "jane_doe@example.com"}, {"email": "janeXdoe@example.com"}
+        )
+
+        response = authed_client.get("/api/admin/applications?search=jane_doe")
+        assert [item["email"] for item in response.json()["items"]] == [
+            "jane_doe@example.com"
+        ]
+
+        response = authed_client.get("/api/admin/applications?search=%25")
+        assert response.json()["total"] == 0
+
 
 class TestSummary:
     """Tests for dashboard summary endpoint."""
 
-    def test_get_summary_empty(self, client: TestClient, auth_headers: dict):
+    def test_get_summary_empty(self, authed_client: TestClient):
         """Test summary with no applications."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/summary", headers=auth_headers)
+        response = authed_client.get("/api/admin/summary")
         assert response.status_code == 200
         data = response.json()
         assert data["total_applications"] == 0
         assert data["total_value"] == 0
 
     def test_get_summary_with_data(
-        self, client: TestClient, auth_headers: dict, created_application: dict
+        self, authed_client: TestClient, created_application: dict
     ):
         """Test summary with application data."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/summary", headers=auth_headers)
+        response = authed_client.get("/api/admin/summary")
         assert response.status_code == 200
         data = response.json()
         assert data["total_applications"] >= 1
@@ -163,14 +168,9 @@ class TestSummary:
 class TestAnalytics:
     """Tests for analytics endpoint."""
 
-    def test_get_analytics(
-        self, client: TestClient, auth_headers: dict, created_application: dict
-    ):
+    def test_get_analytics(self, authed_client: TestClient, created_application: dict):
         """Test analytics data retrieval."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/analytics", headers=auth_headers)
+        response = authed_client.get("/api/admin/analytics")
         assert response.status_code == 200
         data = response.json()
         assert "by_applicant_type" in data
@@ -178,29 +178,32 @@ class TestAnalytics:
         assert "by_tenor" in data
         assert "value_distribution" in data
 
+    def test_value_distribution_buckets(
+        self, authed_client: TestClient, seed_applications: Callable
+    ):
+        """Test bond values land in half-open ranges, with an open top bucket."""
+        seed_applications(
+            *({"bond_value": v} for v in (10_000, 49_999, 50_000, 5_000_000))
+        )
+
+        response = authed_client.get("/api/admin/analytics")
+        counts = [b["count"] for b in response.json()["value_distribution"]]
+
+        assert counts == [0, 2, 1, 0, 0, 1]
+
 
 class TestExports:
     """Tests for export endpoints."""
 
-    def test_export_csv(
-        self, client: TestClient, auth_headers: dict, created_application: dict
-    ):
+    def test_export_csv(self, authed_client: TestClient, created_application: dict):
         """Test CSV export."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/export/csv", headers=auth_headers)
+        response = authed_client.get("/api/admin/export/csv")
         assert response.status_code == 200
         assert "text/csv" in response.headers["content-type"]
 
-    def test_export_excel(
-        self, client: TestClient, auth_headers: dict, created_application: dict
-    ):
+    def test_export_excel(self, authed_client: TestClient, created_application: dict):
         """Test Excel export."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/export/excel", headers=auth_headers)
+        response = authed_client.get("/api/admin/export/excel")
         assert response.status_code == 200
         content_type = response.headers["content-type"]
         assert "spreadsheet" in content_type or "excel" in content_type.lower()
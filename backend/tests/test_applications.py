@@ -2,6 +2,9 @@
 Tests for application CRUD endpoints.
 """
 
+from collections.abc import Mapping
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -10,10 +13,12 @@ class TestCreateApplication:
     """Tests for creating applications."""
 
     def test_create_individual_application(
-        self, client: TestClient, sample_individual_application: dict
+        self, client: TestClient, sample_individual_json: bytes, json_headers: dict
     ):
         """Test creating an Individual application."""
-        response = client.post("/api/applications", json=sample_individual_application)
+        response = client.post(
+            "/api/applications", content=sample_individual_json, headers=json_headers
+        )
         assert response.status_code == 201
 
         data = response.json()
@@ -24,10 +29,12 @@ class TestCreateApplication:
         assert data["payment_status"] == "pending"
 
     def test_create_joint_application(
-        self, client: TestClient, sample_joint_application: dict
+        self, client: TestClient, sample_joint_json: bytes, json_headers: dict
     ):
         """Test creating a Joint application."""
-        response = client.post("/api/applications", json=sample_joint_application)
+        response = client.post(
+            "/api/applications", content=sample_joint_json, headers=json_headers
+        )
         assert response.status_code == 201
 
         data = response.json()
@@ -36,10 +43,12 @@ class TestCreateApplication:
         assert data["joint_full_name"] == "Jane Doe"
 
     def test_create_corporate_application(
-        self, client: TestClient, sample_corporate_application: dict
+        self, client: TestClient, sample_corporate_json: bytes, json_headers: dict
     ):
         """Test creating a Corporate application."""
-        response = client.post("/api/applications", json=sample_corporate_application)
+        response = client.post(
+            "/api/applications", content=sample_corporate_json, headers=json_headers
+        )
         assert response.status_code == 201
 
         data = response.json()
@@ -47,62 +56,52 @@ class TestCreateApplication:
         assert data["company_name"] == "Test Company Ltd"
         assert data["rc_number"] == "RC123456"
 
-    def test_create_application_with_minimum_value(
-        self, client: TestClient, sample_individual_application: dict
+    @pytest.mark.parametrize(
+        "bond_value,amount_in_words,expected_status",
+        [
+            (5000, "Five Thousand Naira Only", 201),
+            (50000000, "Fifty Million Naira Only", 201),
+            (1000, None, 422),
+            (100000000, None, 422),
+        ],
+        ids=["minimum", "maximum", "too_low", "too_high"],
+    )
+    def test_create_application_bond_value(
+        self,
+        client: TestClient,
+        sample_individual_application: Mapping,
+        bond_value: int,
+        amount_in_words: str | None,
+        expected_status: int,
     ):
-        """Test creating application with minimum bond value."""
-        sample_individual_application["bond_value"] = 5000
-        sample_individual_application["amount_in_words"] = "Five Thousand Naira Only"
-
-        response = client.post("/api/applications", json=sample_individual_application)
-        assert response.status_code == 201
-        assert response.json()["bond_value"] == 5000
-
-    def test_create_application_with_maximum_value(
-        self, client: TestClient, sample_individual_application: dict
+        """Test bond values at and beyond the allowed range."""
+        data = dict(sample_individual_application)
+        data["bond_value"] = bond_value
+        if amount_in_words is not None:
+            data["amount_in_words"] = amount_in_words
+
+        response = client.post("/api/applications", json=data)
+        assert response.status_code == expected_status
+        if expected_status == 201:
+            assert response.json()["bond_value"] == bond_value
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [("tenor", "5-Year"), ("email", "not-an-email")],
+        ids=["invalid_tenor", "invalid_email"],
+    )
+    def test_create_application_invalid_field(
+        self,
+        client: TestClient,
+        sample_individual_application: Mapping,
+        field: str,
+        value: str,
     ):
-        """Test creating application with maximum bond value."""
-        sample_individual_application["bond_value"] = 50000000
-        sample_individual_application["amount_in_words"] = "Fifty Million Naira Only"
-
-        response = client.post("/api/applications", json=sample_individual_application)
-        assert response.status_code == 201
-        assert response.json()["bond_value"] == 50000000
+        """Test creating application with an invalid field value fails."""
+        data = dict(sample_individual_application)
+        data[field] = value
 
-    def test_create_application_invalid_tenor(
-        self, client: TestClient, sample_individual_application: dict
-    ):
-        """Test creating application with invalid tenor fails."""
-        sample_individual_application["tenor"] = "5-Year"
-
-        response = client.post("/api/applications", json=sample_individual_application)
-        assert response.status_code == 422
-
-    def test_create_application_invalid_email(
-        self, client: TestClient, sample_individual_application: dict
-    ):
-        """Test creating application with invalid email fails."""
-        sample_individual_application["email"] = "not-an-email"
-
-        response = client.post("/api/applications", json=sample_individual_application)
-        assert response.status_code == 422
-
-    def test_create_application_bond_value_too_low(
-        self, client: TestClient, sample_individual_application: dict
-    ):
-        """Test creating application with bond value below minimum fails."""
-        sample_individual_application["bond_value"] = 1000
-
-        response = client.post("/api/applications", json=sample_individual_application)
-        assert response.status_code == 422
-
-    def test_create_application_bond_value_too_high(
-        self, client: TestClient, sample_individual_application: dict
-    ):
-        """Test creating application with bond value above maximum fails."""
-        sample_individual_application["bond_value"] = 100000000
-
-        response = client.post("/api/applications", json=sample_individual_application)
+        response = client.post("/api/applications", json=data)
         assert response.status_code == 422
 
 
@@ -134,13 +133,16 @@ class TestGetApplication:
 class TestDownloadPdf:
     """Tests for PDF download endpoint."""
 
-    def test_download_pdf_success(self, client: TestClient, created_application: dict):
+    def test_download_pdf_success(
+        self, client: TestClient, created_application: dict, stub_pdf: Path
+    ):
         """Test downloading PDF for an application."""
         app_id = created_application["id"]
 
         response = client.get(f"/api/applications/{app_id}/pdf")
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/pdf"
+        assert response.content == stub_pdf.read_bytes()
 
     def test_download_pdf_not_found(self, client: TestClient):
         """Test downloading PDF for non-existent application returns 404."""
@@ -148,7 +150,7 @@ class TestDownloadPdf:
         assert response.status_code == 404
 
     def test_download_pdf_has_filename(
-        self, client: TestClient, created_application: dict
+        self, client: TestClient, created_application: dict, stub_pdf: Path
     ):
         """Test PDF download has proper filename header."""
         app_id = created_application["id"]
@@ -2,7 +2,6 @@
 Tests for authentication endpoints.
 """
 
-import pytest
 from fastapi.testclient import TestClient
 
 
@@ -60,12 +59,9 @@ class TestAuthentication:
         )
         assert response.status_code == 401
 
-    def test_get_current_user(self, client: TestClient, auth_headers: dict):
+    def test_get_current_user(self, authed_client: TestClient):
         """Test getting current user info."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/auth/me", headers=auth_headers)
+        response = authed_client.get("/api/auth/me")
         assert response.status_code == 200
         data = response.json()
         assert "username" in data
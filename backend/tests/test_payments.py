@@ -2,30 +2,28 @@
 Tests for payment management endpoints.
 """
 
+from collections.abc import Mapping
+
 import pytest
 from fastapi.testclient import TestClient
 
+PAY_URL = "/api/admin/applications/{}/payment".format
+VERIFY_URL = "/api/admin/payments/{}/verify".format
+PAY_MOD_URL = "/api/admin/payments/{}".format
+
 
 class TestRecordPayment:
     """Tests for recording payments."""
 
     def test_record_payment_success(
         self,
-        client: TestClient,
-        auth_headers: dict,
+        authed_client: TestClient,
         created_application: dict,
-        sample_payment: dict,
+        sample_payment: Mapping,
     ):
         """Test recording a payment for an application."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         app_id = created_application["id"]
-        response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
+        response = authed_client.post(PAY_URL(app_id), json=dict(sample_payment))
 
         assert response.status_code == 200
         data = response.json()
@@ -35,56 +33,31 @@ class TestRecordPayment:
         assert data["status"] == "pending"
 
     def test_record_payment_requires_auth(
-        self, client: TestClient, created_application: dict, sample_payment: dict
+        self, client: TestClient, created_application: dict, sample_payment: Mapping
     ):
         """Test recording payment requires authentication."""
         app_id = created_application["id"]
-        response = client.post(
-            f"/api/admin/applications/{app_id}/payment", json=sample_payment
-        )
+        response = client.post(PAY_URL(app_id), json=dict(sample_payment))
         assert response.status_code == 401
 
     def test_record_duplicate_payment_fails(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
+        authed_client: TestClient,
+        recorded_payment: dict,
+        sample_payment: Mapping,
     ):
         """Test recording duplicate payment for same application fails."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # First payment
-        response1 = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        assert response1.status_code == 200
+        app_id = recorded_payment["app_id"]
 
         # Second payment should fail
-        response2 = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
+        response2 = authed_client.post(PAY_URL(app_id), json=dict(sample_payment))
         assert response2.status_code in [400, 409]
 
     def test_record_payment_for_nonexistent_application(
-        self, client: TestClient, auth_headers: dict, sample_payment: dict
+        self, authed_client: TestClient, sample_payment: Mapping
     ):
         """Test recording payment for non-existent application fails."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.post(
-            "/api/admin/applications/99999/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
+        response = authed_client.post(PAY_URL(99999), json=dict(sample_payment))
         assert response.status_code == 404
 
 
@@ -93,172 +66,76 @@ class TestGetPayment:
 
     def test_get_payment_success(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
+        authed_client: TestClient,
+        recorded_payment: dict,
+        sample_payment: Mapping,
     ):
         """Test getting payment details for an application."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # Record a payment first
-        client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
+        app_id = recorded_payment["app_id"]
 
         # Get payment
-        response = client.get(
-            f"/api/admin/applications/{app_id}/payment", headers=auth_headers
-        )
+        response = authed_client.get(PAY_URL(app_id))
         assert response.status_code == 200
         data = response.json()
         assert data["amount"] == sample_payment["amount"]
 
     def test_get_payment_not_found(
-        self, client: TestClient, auth_headers: dict, created_application: dict
+        self, authed_client: TestClient, created_application: dict
     ):
         """Test getting payment for application without payment."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         app_id = created_application["id"]
-        response = client.get(
-            f"/api/admin/applications/{app_id}/payment", headers=auth_headers
-        )
+        response = authed_client.get(PAY_URL(app_id))
         assert response.status_code == 404
 
 
 class TestVerifyPayment:
     """Tests for payment verification workflow."""
 
-    def test_verify_payment_success(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
-    ):
-        """Test verifying a payment."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # Record payment
-        payment_response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        payment_id = payment_response.json()["id"]
-
-        # Verify payment
-        response = client.post(
-            f"/api/admin/payments/{payment_id}/verify",
-            json={"action": "verify"},
-            headers=auth_headers,
-        )
-        assert response.status_code == 200
-        assert response.json()["status"] == "verified"
-
-    def test_reject_payment_success(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
-    ):
-        """Test rejecting a payment with reason."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # Record payment
-        payment_response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        payment_id = payment_response.json()["id"]
-
-        # Reject payment
-        response = client.post(
-            f"/api/admin/payments/{payment_id}/verify",
-            json={"action": "reject", "rejection_reason": "Invalid reference number"},
-            headers=auth_headers,
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "rejected"
-        assert "Invalid reference" in data.get("rejection_reason", "")
-
-    def test_reject_payment_requires_reason(
+    @pytest.mark.parametrize(
+        "payload,expected_status,expected_payment_status",
+        [
+            ({"action": "verify"}, 200, "verified"),
+            (
+                {"action": "reject", "rejection_reason": "Invalid reference number"},
+                200,
+                "rejected",
+            ),
+            ({"action": "reject"}, 422, None),  # Rejection needs a reason
+        ],
+        ids=["verify", "reject", "reject_without_reason"],
+    )
+    def test_verify_action(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
+        authed_client: TestClient,
+        recorded_payment: dict,
+        payload: dict,
+        expected_status: int,
+        expected_payment_status: str | None,
     ):
-        """Test rejecting payment without reason fails."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
+        """Test verifying or rejecting a recorded payment."""
+        payment_id = recorded_payment["id"]
 
-        # Record payment
-        payment_response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        payment_id = payment_response.json()["id"]
-
-        # Reject without reason
-        response = client.post(
-            f"/api/admin/payments/{payment_id}/verify",
-            json={"action": "reject"},
-            headers=auth_headers,
-        )
-        assert response.status_code == 422
+        response = authed_client.post(VERIFY_URL(payment_id), json=payload)
+        assert response.status_code == expected_status
+        if expected_payment_status is not None:
+            data = response.json()
+            assert data["status"] == expected_payment_status
+            if "rejection_reason" in payload:
+                assert "Invalid reference" in data.get("rejection_reason", "")
 
 
 class TestUpdatePayment:
     """Tests for updating payments."""
 
     def test_update_pending_payment(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
+        self, authed_client: TestClient, recorded_payment: dict
     ):
         """Test updating a pending payment."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # Record payment
-        payment_response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        payment_id = payment_response.json()["id"]
+        payment_id = recorded_payment["id"]
 
         # Update payment
         update_data = {"amount": 150000, "notes": "Updated payment"}
-        response = client.patch(
-            f"/api/admin/payments/{payment_id}",
-            json=update_data,
-            headers=auth_headers,
-        )
+        response = authed_client.patch(PAY_MOD_URL(payment_id), json=update_data)
         assert response.status_code == 200
         data = response.json()
         assert data["amount"] == 150000
@@ -269,34 +146,16 @@ class TestDeletePayment:
     """Tests for deleting payments."""
 
     def test_delete_pending_payment(
-        self,
-        client: TestClient,
-        auth_headers: dict,
-        created_application: dict,
-        sample_payment: dict,
+        self, authed_client: TestClient, recorded_payment: dict
     ):
         """Test deleting a pending payment."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        app_id = created_application["id"]
-
-        # Record payment
-        payment_response = client.post(
-            f"/api/admin/applications/{app_id}/payment",
-            json=sample_payment,
-            headers=auth_headers,
-        )
-        payment_id = payment_response.json()["id"]
+        payment_id = recorded_payment["id"]
+        app_id = recorded_payment["app_id"]
 
         # Delete payment
-        response = client.delete(
-            f"/api/admin/payments/{payment_id}", headers=auth_headers
-        )
+        response = authed_client.delete(PAY_MOD_URL(payment_id))
         assert response.status_code == 204
 
         # Verify it's deleted
-        get_response = client.get(
-            f"/api/admin/applications/{app_id}/payment", headers=auth_headers
-        )
+        get_response = authed_client.get(PAY_URL(app_id))
         assert get_response.status_code == 404
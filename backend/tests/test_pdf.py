@@ -0,0 +1,103 @@
+"""
+Tests for the PDF generation module.
+"""
+
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from app.models import Application
+from app.schemas.application import ApplicationCreate
+from app.services.pdf import generate_application_pdf
+from pdf import FGNSBBatchGenerator, FGNSBTemplate, generate_batch
+
+pytestmark = pytest.mark.slow
+
+
+class TestFGNSBTemplate:
+    """Tests for rendering a single subscription form."""
+
+    def test_generate_all_applicant_types(
+        self,
+        tmp_path: Path,
+        sample_individual_application: Mapping,
+        sample_joint_application: Mapping,
+        sample_corporate_application: Mapping,
+    ):
+        """Test each applicant type renders to a PDF file."""
+        for data in (
+            sample_individual_application,
+            sample_joint_application,
+            sample_corporate_application,
+        ):
+            output_path = tmp_path / f"{data['applicant_type']}.pdf"
+            assert FGNSBTemplate(data).generate(str(output_path)) is True
+            assert output_path.read_bytes().startswith(b"%PDF")
+
+    def test_footer_uses_injected_timestamp(
+        self, sample_individual_application: Mapping
+    ):
+        """Test a supplied timestamp is rendered in the footer."""
+        elements = FGNSBTemplate(sample_individual_application).build_document(
+            timestamp="2026-01-15 09:30:00"
+        )
+
+        assert elements[-1].text == "Generated on: 2026-01-15 09:30:00"
+
+
+class TestGenerateApplicationPdf:
+    """Tests for the service that renders a stored application."""
+
+    def test_generate_application_pdf(self, sample_joint_application: Mapping):
+        """Test an Application row renders to a real PDF file."""
+        application = Application(
+            **ApplicationCreate(**sample_joint_application).model_dump()
+        )
+
+        pdf_path = Path(generate_application_pdf(application))
+        try:
+            assert pdf_path.read_bytes().startswith(b"%PDF")
+        finally:
+            pdf_path.unlink()
+
+
+class TestGenerateBatch:
+    """Tests for batch PDF generation."""
+
+    def test_generate_batch(
+        self,
+        tmp_path: Path,
+        sample_individual_application: Mapping,
+        sample_corporate_application: Mapping,
+    ):
+        """Test a batch writes one PDF per record, in input order."""
+        records = [
+            {**sample_individual_application, "id": 1},
+            {**sample_corporate_application, "id": 2},
+        ]
+
+        paths = generate_batch(records, str(tmp_path), workers=2)
+
+        assert [Path(p).name for p in paths] == ["fgnsb_1.pdf", "fgnsb_2.pdf"]
+        assert all(Path(p).read_bytes().startswith(b"%PDF") for p in paths)
+
+    def test_generate_batch_empty(self, tmp_path: Path):
+        """Test an empty batch returns no paths."""
+        assert generate_batch([], str(tmp_path)) == []
+
+    def test_batch_generator_reuses_document(
+        self,
+        tmp_path: Path,
+        sample_individual_application: Mapping,
+        sample_joint_application: Mapping,
+    ):
+        """Test the sequential batch generator renders every record."""
+        generator = FGNSBBatchGenerator()
+
+        paths = generator.generate(
+            [sample_individual_application, sample_joint_application], str(tmp_path)
+        )
+
+        assert [Path(p).name for p in paths] == ["fgnsb_0.pdf", "fgnsb_1.pdf"]
+        assert all(Path(p).read_bytes().startswith(b"%PDF") for p in paths)
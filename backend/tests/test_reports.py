@@ -2,21 +2,18 @@
 Tests for DMO reporting endpoints.
 """
 
-import pytest
+from collections.abc import Callable
+
 from fastapi.testclient import TestClient
 
 
 class TestMonthlyReportSummary:
     """Tests for monthly report summary endpoint."""
 
-    def test_get_monthly_summary_empty(self, client: TestClient, auth_headers: dict):
+    def test_get_monthly_summary_empty(self, authed_client: TestClient):
         """Test monthly summary with no data."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get(
+        response = authed_client.get(
             "/api/admin/reports/monthly-summary?month_of_offer=January&year=2026",
-            headers=auth_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -26,21 +23,15 @@ class TestMonthlyReportSummary:
 
     def test_get_monthly_summary_with_data(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test monthly summary with application data."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application for January
-        sample_individual_application["month_of_offer"] = "January"
-        client.post("/api/applications", json=sample_individual_application)
+        seed_applications({"month_of_offer": "January"})
 
-        response = client.get(
+        response = authed_client.get(
             "/api/admin/reports/monthly-summary?month_of_offer=January&year=2026",
-            headers=auth_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -63,25 +54,21 @@ class TestDMOReportExport:
 
     def test_export_dmo_report(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test exporting DMO report as Excel."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application
-        sample_individual_application["month_of_offer"] = "January"
-        client.post("/api/applications", json=sample_individual_application)
+        seed_applications({"month_of_offer": "January"})
 
-        response = client.get(
+        # Only the headers are checked, so don't read the workbook body
+        with authed_client.stream(
+            "GET",
             "/api/admin/reports/export/excel?month_of_offer=January&year=2026",
-            headers=auth_headers,
-        )
-        assert response.status_code == 200
-        content_type = response.headers["content-type"]
-        assert "spreadsheet" in content_type or "excel" in content_type.lower()
+        ) as response:
+            assert response.status_code == 200
+            content_type = response.headers["content-type"]
+            assert "spreadsheet" in content_type or "excel" in content_type.lower()
 
     def test_export_dmo_report_requires_auth(self, client: TestClient):
         """Test DMO report export requires authentication."""
@@ -96,23 +83,17 @@ class TestDMOSubmission:
 
     def test_mark_as_submitted(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test marking a month as submitted to DMO."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application
-        sample_individual_application["month_of_offer"] = "February"
-        client.post("/api/applications", json=sample_individual_application)
+        seed_applications({"month_of_offer": "February"})
 
         # Mark as submitted
-        response = client.post(
+        response = authed_client.post(
             "/api/admin/reports/submit-to-dmo",
             json={"month_of_offer": "February", "year": 2026},
-            headers=auth_headers,
         )
         assert response.status_code in [200, 201]
         data = response.json()
@@ -122,31 +103,24 @@ class TestDMOSubmission:
 
     def test_prevent_duplicate_submission(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test preventing duplicate submission for same period."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application
-        sample_individual_application["month_of_offer"] = "March"
-        client.post("/api/applications", json=sample_individual_application)
+        seed_applications({"month_of_offer": "March"})
 
         # First submission
-        response1 = client.post(
+        response1 = authed_client.post(
             "/api/admin/reports/submit-to-dmo",
             json={"month_of_offer": "March", "year": 2026},
-            headers=auth_headers,
         )
         assert response1.status_code in [200, 201]
 
         # Second submission should fail
-        response2 = client.post(
+        response2 = authed_client.post(
             "/api/admin/reports/submit-to-dmo",
             json={"month_of_offer": "March", "year": 2026},
-            headers=auth_headers,
         )
         assert response2.status_code in [400, 409]
 
@@ -154,38 +128,29 @@ class TestDMOSubmission:
 class TestSubmissionHistory:
     """Tests for DMO submission history."""
 
-    def test_get_submission_history_empty(self, client: TestClient, auth_headers: dict):
+    def test_get_submission_history_empty(self, authed_client: TestClient):
         """Test getting submission history when empty."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
-        response = client.get("/api/admin/reports/submissions", headers=auth_headers)
+        response = authed_client.get("/api/admin/reports/submissions")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
 
     def test_get_submission_history_with_data(
         self,
-        client: TestClient,
-        auth_headers: dict,
-        sample_individual_application: dict,
+        authed_client: TestClient,
+        seed_applications: Callable,
     ):
         """Test getting submission history after submissions."""
-        if not auth_headers:
-            pytest.skip("Auth not available")
-
         # Create application and submit
-        sample_individual_application["month_of_offer"] = "April"
-        client.post("/api/applications", json=sample_individual_application)
+        seed_applications({"month_of_offer": "April"})
 
-        client.post(
+        authed_client.post(
             "/api/admin/reports/submit-to-dmo",
             json={"month_of_offer": "April", "year": 2026},
-            headers=auth_headers,
         )
 
         # Get history
-        response = client.get("/api/admin/reports/submissions", headers=auth_headers)
+        response = authed_client.get("/api/admin/reports/submissions")
         assert response.status_code == 200
         data = response.json()
         assert len(data) >= 1
@@ -79,16 +79,20 @@ export function formatMoneyInWords(amount: number): string {
   return result;
 }
 
+// Building an Intl.NumberFormat is far costlier than calling format(), and
+// formatCurrency runs once per table row, so share a single instance.
+const nairaFormatter = new Intl.NumberFormat('en-NG', {
+  style: 'currency',
+  currency: 'NGN',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0,
+});
+
 /**
  * Format number as Nigerian Naira currency.
  */
 export function formatCurrency(amount: number): string {
-  return new Intl.NumberFormat('en-NG', {
-    style: 'currency',
-    currency: 'NGN',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(amount);
+  return nairaFormatter.format(amount);
 }
 
 /**